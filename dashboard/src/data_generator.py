@@ -19,33 +19,34 @@ and procurement analytics dashboards.
 """
 
 import pandas as pd
+import numpy as np
 import random
-from datetime import datetime, timedelta
+import functools
+from datetime import datetime
 from utils import load_json_data_list
 from constants import *
-from datetime import datetime, timedelta
 
 import os
 from glob import glob
 
-def generate_provider(provider: str) -> str:
-    """
-    Create realistic variations of provider names to simulate data inconsistencies.
+# Common substitutions/abbreviations to simulate messy data
+_SUBSTITUTIONS = {
+    "Limited": ["Ltd", "LTD"],
+    "Pty Ltd": ["Pty. Ltd.", "P/L"],
+    "Management": ["Mgmt"],
+    "International": ["Intl", "Int’l"],
+    ".": ["..", "", ",", "/"]
+}
 
-    Variations include:
-        - Casing differences (UPPERCASE, lowercase, title case).
-        - Added suffixes (e.g., "(AU)", "(AUS)").
-        - Truncated or shortened names (first-half section and first word).
-        - Common abbreviations (e.g., Management -> Mgmt, International -> Intl).
-        - Extra dots or missing dots
-        - Random typos and misspellings.
-        - Extra or missing spaces.
 
-    Args:
-        provider (str): The provider's official/legal name.
+@functools.lru_cache(maxsize=None)
+def _provider_variants(provider: str) -> tuple:
+    """
+    Build the deterministic name variants for one provider.
 
-    Returns:
-        str: A randomly chosen variation of the provider's name.
+    Cached: generate_transactions draws thousands of records from a small
+    set of providers, so the variant list is assembled once per provider
+    instead of once per record. Only the random typo stays per-call.
     """
     # Basic variations
     options = [
@@ -60,67 +61,102 @@ def generate_provider(provider: str) -> str:
         provider[:max(5, len(provider)//2)]# truncate halfway (e.g., "Cleanaway Waste M")
     ]
 
-    # Common substitutions/abbreviations to simulate messy data
-    substitutions = {
-        "Limited": ["Ltd", "LTD"],
-        "Pty Ltd": ["Pty. Ltd.", "P/L"],
-        "Management": ["Mgmt"],
-        "International": ["Intl", "Int’l"],
-        ".": ["..", "", ",", "/"]
-    }
-
     # Apply substitutions and append to variations
-    for key, subs in substitutions.items():
+    for key, subs in _SUBSTITUTIONS.items():
         if key in provider:
             for s in subs:
                 options.append(provider.replace(key, s))
 
-    # Introduce a random typo
-    if len(provider) > 4:
-        typo_index = random.randint(0, len(provider) - 1)
-        typo_char = random.choice("abcdefghijklmnopqrstuvwxyz")
-        typo_version = provider[:typo_index] + typo_char + provider[typo_index + 1:]
-        options.append(typo_version)
-
     # Modify spaces for more messiness
     if " " in provider:
         options.append(provider.replace(" ", "  "))  # double spaces
         options.append(provider.replace(" ", ""))    # remove all spaces
 
-    return random.choice(options)
+    return tuple(options)
+
+
+def generate_provider(provider: str) -> str:
+    """
+    Create realistic variations of provider names to simulate data inconsistencies.
+
+    Variations include:
+        - Casing differences (UPPERCASE, lowercase, title case).
+        - Added suffixes (e.g., "(AU)", "(AUS)").
+        - Truncated or shortened names (first-half section and first word).
+        - Common abbreviations (e.g., Management -> Mgmt, International -> Intl).
+        - Extra dots or missing dots
+        - Random typos and misspellings.
+        - Extra or missing spaces.
 
+    Args:
+        provider (str): The provider's official/legal name.
 
-def generate_date(start_year: int = 2025, end_year: int = 2030, miss_possibility: float = DEFAULT_POSSIBILITY) -> str:
+    Returns:
+        str: A randomly chosen variation of the provider's name.
     """
-    Generate a random date within a range, with inconsistent formatting.
+    variants = _provider_variants(provider)
+
+    # The typo variant is random per call, so it lives outside the cached
+    # tuple: reserve one extra slot for it to keep the choice uniform
+    if len(provider) > 4:
+        chosen = random.randint(0, len(variants))
+        if chosen == len(variants):
+            typo_index = random.randint(0, len(provider) - 1)
+            typo_char = random.choice("abcdefghijklmnopqrstuvwxyz")
+            return provider[:typo_index] + typo_char + provider[typo_index + 1:]
+        return variants[chosen]
+
+    return random.choice(variants)
+
+
+def generate_dates(num_dates: int, start_year: int = 2025, end_year: int = 2030,
+                   miss_possibility: float = DEFAULT_POSSIBILITY) -> np.ndarray:
+    """
+    Generate random dates within a range, with inconsistent formatting.
     Simulates messy invoice or contract dates in procurement data.
 
+    All dates are drawn in a single vectorized pass: one integer draw for
+    the day offsets from the start-of-range anchor, one draw for the format
+    choice, and one strftime per distinct format instead of per record.
+
     Args:
+        num_dates (int): Number of dates to generate.
         start_year (int, optional): Start year for date generation (default: 2025)
         end_year (int, optional): End year for date generation (default: 2030)
         miss_possibility (float, optional): Possibility of leave date as empty
 
     Returns:
-        str: A randomly formatted date, or empty string (5% chance).
+        np.ndarray: Randomly formatted date strings, with occasional empties.
     """
-    # Define date range
-    start = datetime(start_year, 1, 1)
-    end = datetime(end_year, 1, 1)
+    rng = np.random.default_rng()
 
-    # Generate a random date within the range
-    date_obj = start + timedelta(days=random.randint(0, (end - start).days))
+    # Random day offsets from the anchor date, all drawn at once
+    anchor = np.datetime64(f"{start_year}-01-01")
+    span_days = int((np.datetime64(f"{end_year}-01-01") - anchor) / np.timedelta64(1, "D"))
+    offsets = rng.integers(0, span_days + 1, num_dates)
+    dates = pd.to_datetime(anchor + offsets.astype("timedelta64[D]"))
 
-    # Various formats to mimic inconsistent data
-    options = [
+    # Various formats to mimic inconsistent data; the last slot is
+    # occasionally blanked out to simulate missing dates
+    formats = np.array([
         "%Y-%m-%d",   # 2025-01-01 (ISO)
         "%d/%m/%Y",   # 01/01/2025 (AU style)
         "%d-%b-%Y",   # 01-Jan-2025
         "%d %B %Y",   # 01 January 2025
         "%y/%m/%d",   # 25/01/01
-        "" if random.random() < miss_possibility else "%d/%m/%Y"  # occasional missing
-    ]
-    
-    return date_obj.strftime(random.choice(options))
+        "%d/%m/%Y",   # occasional missing (see mask below)
+    ])
+    chosen = rng.integers(0, len(formats), num_dates)
+    missing_mask = (chosen == len(formats) - 1) & (rng.random(num_dates) < miss_possibility)
+
+    # One vectorized strftime per distinct format, scattered back in place
+    formatted = np.empty(num_dates, dtype=object)
+    for fmt_idx in np.unique(chosen):
+        fmt_mask = chosen == fmt_idx
+        formatted[fmt_mask] = np.asarray(dates[fmt_mask].strftime(str(formats[fmt_idx])), dtype=object)
+    formatted[missing_mask] = ""
+
+    return formatted
 
 
 def generate_invoice_amount(unit: int = DEFAULT_UNIT, miss_possibility: float = DEFAULT_POSSIBILITY) -> str:
@@ -177,25 +213,36 @@ def generate_transactions(contracts: list, num_records: int = 1000, miss_possibi
         pd.DataFrame: A DataFrame containing messy procurement transaction records.
     """
 
-    records = []
-
-    title_options = list({c["contract_title"] for c in contracts})
-
-    for i in range(num_records):
-        # Pick a random contract as the seed for this transaction
-        contract = random.choice(contracts)
-
-        # Create the messy transaction record
-        records.append({
-            "InvoiceID": f"INV{start_invoice_id+i}",
-            "ContractTitle": random.choice(title_options) if random.random() < miss_possibility else contract.get("contract_title", ""),
-            "Provider": generate_provider(contract.get("service_provider", "")),
-            "InvoiceAmount": generate_invoice_amount(),
-            "InvoiceDate": generate_date(2025, 2030),
-            "ContractNumber": " " if random.random() < miss_possibility else contract.get("contract_number", "")
-        })
-
-    return pd.DataFrame(records)
+    rng = np.random.default_rng()
+
+    title_options = np.array(list({c["contract_title"] for c in contracts}), dtype=object)
+    contract_titles = np.array([c.get("contract_title", "") for c in contracts], dtype=object)
+    contract_numbers = np.array([c.get("contract_number", "") for c in contracts], dtype=object)
+    contract_providers = np.array([c.get("service_provider", "") for c in contracts], dtype=object)
+
+    # Draw all per-record randomness in one vectorized call per field,
+    # instead of calling the random module once per record
+    contract_idx = rng.integers(0, len(contracts), num_records)
+    random_title_mask = rng.random(num_records) < miss_possibility
+    missing_number_mask = rng.random(num_records) < miss_possibility
+
+    # Pick each record's seed contract via fancy indexing, then overwrite
+    # the randomly-mismatched titles and missing contract numbers in place
+    titles = contract_titles[contract_idx]
+    titles[random_title_mask] = rng.choice(title_options, random_title_mask.sum())
+    numbers = contract_numbers[contract_idx]
+    numbers[missing_number_mask] = " "
+
+    # Build the frame once from arrays; the per-record messiness helpers
+    # remain the only Python-level loop work
+    return pd.DataFrame({
+        "InvoiceID": [f"INV{start_invoice_id + i}" for i in range(num_records)],
+        "ContractTitle": titles,
+        "Provider": [generate_provider(p) for p in contract_providers[contract_idx]],
+        "InvoiceAmount": [generate_invoice_amount() for _ in range(num_records)],
+        "InvoiceDate": generate_dates(num_records, 2025, 2030),
+        "ContractNumber": numbers,
+    })
 
 
 if __name__ == "__main__":
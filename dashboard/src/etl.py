@@ -16,288 +16,494 @@ Key ETL tasks:
     - Track fields that failed cleaning (NeedsAttention).
     - Track fields that were modified/normalized (ModifiedFields).
 
-    - Load: Save cleaned dataset into a structured CSV for analytics and dashboards.
+    - Load: Append cleaned dataset into a Parquet dataset partitioned by
+      ingest date for analytics and dashboards.
 """
 
 import pandas as pd
 import numpy as np
 import re
-from datetime import datetime
+import functools
+
+import pyarrow as pa
+from dateutil import parser as dateutil_parser
+from joblib import Parallel, delayed
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.neighbors import NearestNeighbors
 
 from utils import *
 
 from constants import *
 
-from fuzzywuzzy import process, fuzz
+from rapidfuzz import process, fuzz, utils as fuzz_utils
 
-from typing import Optional, Tuple
+from typing import Tuple
 
 import os
 from glob import glob
 
-def clean_provider(provider: str, correct_providers: list, high_threshold: int = 80, low_threshold: int = 60) ->  Tuple[Optional[bool], Optional[str]]:
+# --- Precompiled patterns for the hot cleaning paths ---
+# Compiled once at import instead of per call via re's cache lookup.
+_CAMEL_CASE_RE = re.compile(r"(?<=[a-z])([A-Z])")
+# "(AU)"/"(AUS)" suffix variants. The old inline pattern was missing the
+# escaped parens around AUS, so it stripped a bare "AUS" anywhere in the name.
+_AU_SUFFIX_RE = re.compile(r"\(AUS?\)")
+_MILLION_RE = re.compile(r"m|mil|million")
+_NON_NUMERIC_RE = re.compile(r"[^\d.]")
+
+# Common procurement date formats, tried in order (after separator
+# normalization to dashes); the first format that parses a row wins
+_DATE_FORMATS = [
+    "%Y-%m-%d",      # 2025-01-01 (ISO)
+    "%d-%m-%Y",      # 01-01-2025 (AU/EU)
+    "%m-%d-%Y",      # 01-25-2025 (US)
+    "%d-%b-%Y",      # 01-Jan-2025
+    "%d-%B-%Y",      # 01-January-2025
+    "%B-%d-%Y",      # January-01-2025
+    "%y-%m-%d",      # 25-01-01 (2-digit year)
+]
+
+# Above this many known providers, the full queries x choices similarity
+# matrix is skipped: a character-trigram TF-IDF index shortlists the nearest
+# candidates per query and only those get the exact (quadratic) scorer
+_ANN_MIN_CHOICES = 50
+_ANN_CANDIDATES = 10
+
+
+@functools.lru_cache(maxsize=None)
+def _provider_index(correct_providers: tuple):
+    """
+    Build (and cache) a TF-IDF character-trigram vectorizer plus a cosine
+    nearest-neighbour index over the known provider list.
+    """
+    vectorizer = TfidfVectorizer(analyzer="char_wb", ngram_range=(3, 3))
+    matrix = vectorizer.fit_transform(correct_providers)
+    index = NearestNeighbors(metric="cosine").fit(matrix)
+    return vectorizer, index
+
+
+def _best_matches(queries: np.ndarray, correct_providers: list, score_cutoff: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return (best_score, best_choice_index) for every query string.
+
+    Small provider lists are scored exhaustively with one cdist call; large
+    lists go through the trigram shortlist first, so the token_set_ratio
+    scorer only runs on each query's nearest candidates instead of the whole
+    choice list.
+    """
+    if len(correct_providers) < _ANN_MIN_CHOICES:
+        scores = process.cdist(queries, correct_providers, scorer=fuzz.token_set_ratio,
+                               processor=fuzz_utils.default_process, score_cutoff=score_cutoff)
+        best_idx = scores.argmax(axis=1)
+        return scores[np.arange(len(queries)), best_idx], best_idx
+
+    vectorizer, index = _provider_index(tuple(correct_providers))
+    n_candidates = min(_ANN_CANDIDATES, len(correct_providers))
+    _, neighbours = index.kneighbors(vectorizer.transform(queries), n_neighbors=n_candidates)
+
+    # Exact scoring over the shortlisted candidates only
+    best_score = np.zeros(len(queries))
+    best_idx = np.zeros(len(queries), dtype=np.int64)
+    choices = np.array(correct_providers, dtype=object)
+    for i, candidates in enumerate(neighbours):
+        candidate_scores = process.cdist(queries[i:i + 1], choices[candidates],
+                                         scorer=fuzz.token_set_ratio,
+                                         processor=fuzz_utils.default_process,
+                                         score_cutoff=score_cutoff)[0]
+        best = candidate_scores.argmax()
+        best_score[i] = candidate_scores[best]
+        best_idx[i] = candidates[best]
+    return best_score, best_idx
+
+
+def clean_providers(providers: pd.Series, correct_providers: list, high_threshold: int = 80, low_threshold: int = 60) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Clean and normalize provider names using a two-pass fuzzy matching strategy.
+    Clean and normalize a whole column of provider names using a two-pass fuzzy matching strategy.
+
+    Instead of one `extractOne` call per row, the entire column is scored
+    against all known providers in a single `process.cdist` call (one C-level
+    pass over a queries x choices similarity matrix), and numpy picks the best
+    match per row. Rows that miss the strict threshold get a second, batched
+    pass after normalization.
 
     Args:
-        provider (str): Raw provider string with potential inconsistencies.
+        providers (pd.Series): Raw provider strings with potential inconsistencies.
         correct_providers (list): List of known, correct provider names.
         high_threshold (int): High similarity threshold for first-pass strict matching.
         low_threshold (int): Lower similarity threshold for second-pass lenient matching.
 
     Returns:
-        Tuple[Optional[bool], Optional[str]]: (was_modified, cleaned_provider) or (None, original_input) if failed
-        
+        Tuple[np.ndarray, np.ndarray]: (was_modified, cleaned_provider) object arrays
+        aligned with the input; flag is None where no strong match was found.
     """
-    if not provider or not isinstance(provider, str):
-        return (None, provider)
+    n = len(providers)
+    raw = providers.to_numpy(dtype=object)
+    flags = np.full(n, None, dtype=object)
+    cleaned = raw.copy()
+
+    # Rows that are non-empty strings are eligible for matching
+    # (isinstance first: missing markers like pd.NA refuse bool())
+    valid = np.fromiter((isinstance(p, str) and bool(p) for p in raw), dtype=bool, count=n)
+    if not valid.any() or not correct_providers:
+        return flags, cleaned
 
-    original = provider.strip()
+    originals = np.array([p.strip() for p in raw[valid]], dtype=object)
+    cleaned[valid] = originals
 
     # --- First pass: strict matching ---
-    best_match = process.extractOne(original, correct_providers, scorer=fuzz.token_set_ratio)
+    # All rows matched at once (exhaustively or via the trigram shortlist);
+    # argmax per row replaces the per-row extractOne scan
+    best_score, best_idx = _best_matches(originals, correct_providers, low_threshold)
+    matches = np.array(correct_providers, dtype=object)[best_idx]
 
-    if best_match and best_match[1] >= high_threshold:
-        if best_match[0] != original:
-            return (True, best_match[0])
-        else:
-            return (False, original)
+    strict = best_score >= high_threshold
+    valid_idx = np.flatnonzero(valid)
+    cleaned[valid_idx[strict]] = matches[strict]
+    flags[valid_idx[strict]] = matches[strict] != originals[strict]
 
-    # --- Second pass: normalize and fuzzy match ---
+    # --- Second pass: normalize and fuzzy match the leftovers ---
     # Preliminary cleaning
-    # - Strip leading/trailing spaces
     # - Insert spaces before uppercase letters to handle run-on words (camel case) (e.g. "VictorianYMCA" -> "Victorian YMCA")
     # - Remove common suffix variations like "(AU)" or "(AUS)" to normalize
-    cleaned = re.sub(r'(?<=[a-z])([A-Z])', r' \1', original).strip()
-    cleaned = re.sub(r"\(AU\)|(AUS)", "", cleaned).strip()
+    retry = ~strict
+    if retry.any():
+        normalized = np.array([
+            _AU_SUFFIX_RE.sub("", _CAMEL_CASE_RE.sub(r" \1", p).strip()).strip()
+            for p in originals[retry]
+        ], dtype=object)
 
-    # Perform fuzzy matching against the list of correct provider names
-    # - `extractOne` compares `cleaned` provider name to all known providers
-    # - Returns the best match as a tuple: (matched_string, similarity_score)
-    best_match = process.extractOne(cleaned, correct_providers, scorer=fuzz.token_set_ratio)
+        best_score, best_idx = _best_matches(normalized, correct_providers, low_threshold)
+        matches = np.array(correct_providers, dtype=object)[best_idx]
 
-    # Validate the fuzzy match by checking the similarity score
-    # - If the score exceeds the threshold, accept the matched provider name
-    # - Otherwise, keep the original (possibly messy) provider name
-    if best_match and best_match[1] > low_threshold:
+        # Accept the lenient match only above the low threshold; everything
+        # else keeps the original name with a None (failed) flag
+        lenient = best_score > low_threshold
+        retry_idx = valid_idx[retry]
+        cleaned[retry_idx[lenient]] = matches[lenient]
+        flags[retry_idx[lenient]] = matches[lenient] != originals[retry][lenient]
 
-        if best_match[0] != original:
-            return (True, best_match[0])
-        else:
-            return (False, original)
-    else:
-        # Fallback: no strong match found, return the original 
-        return (None, original)
+    return flags, cleaned
 
 
-def clean_invoice_amount(amount: str) -> Tuple[Optional[bool], Optional[float]]:
+def clean_invoice_amounts(amounts: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Cleans and converts a possible messy invoice amount string into a float.
-    
-    This function handles various formats, including currency symbols,
-    shorthand for millions, and missing values.
-    
+    Cleans and converts a whole column of messy invoice amount strings into floats.
+
+    The currency symbols, millions shorthand and stray characters are stripped
+    with vectorized `.str` operations and a single `pd.to_numeric` coercion,
+    instead of regex substitutions and float() calls row by row.
+
     Args:
-        amount (str): The possible messy invoice amount string.
-        
+        amounts (pd.Series): The possibly messy invoice amount strings.
+
     Returns:
-        Tuple[Optional[bool], Optional[float]]: (was_modified, cleaned_amount) or (None, original_input) if failed
+        Tuple[np.ndarray, np.ndarray]: (was_modified, cleaned_amount) object arrays
+        aligned with the input; flag is None where conversion failed or the value
+        was missing.
     """
+    n = len(amounts)
+    raw = amounts.to_numpy(dtype=object)
+    flags = np.full(n, None, dtype=object)
+    cleaned = raw.copy()
+
+    # Everything except missing values (None/NaN/pd.NA) is eligible;
+    # non-strings are stringified
+    valid = np.fromiter((not pd.isna(a) for a in raw), dtype=bool, count=n)
+    if not valid.any():
+        return flags, cleaned
+
+    originals = pd.Series([str(a).strip() for a in raw[valid]])
+    cleaned[valid] = originals.to_numpy(dtype=object)
+
+    # Standardize to lowercase, flag the millions shorthand rows
+    # (e.g. 1.2m, 1.2 mil, 1.2 million), then strip everything that is
+    # not a digit or decimal point — this removes the shorthand letters too
+    lowered = originals.str.lower()
+    is_million = lowered.str.contains("m", regex=False)
+    stripped = lowered.str.replace(_NON_NUMERIC_RE, "", regex=True)
+
+    # Handle cases with multiple decimal points (plain amounts only,
+    # matching the old per-row behaviour); these are rare, so the Python
+    # fix-up loop runs on a handful of rows at most
+    multi_dot = ~is_million & (stripped.str.count(r"\.") > 1)
+    if multi_dot.any():
+        stripped[multi_dot] = stripped[multi_dot].map(
+            lambda s: "".join(s.split(".")[:-1]) + "." + s.split(".")[-1]
+        )
 
-    # Handle missing or invalid inputs
-    if amount is None or (isinstance(amount, float) and np.isnan(amount)):
-        return (None, amount)
-    if not isinstance(amount, str):
-        amount = str(amount)
+    # Single numeric coercion; shorthand rows are scaled to full units
+    values = pd.to_numeric(stripped, errors="coerce")
+    values[is_million] *= DEFAULT_UNIT
+
+    ok = values.notna().to_numpy()
+    valid_idx = np.flatnonzero(valid)
+    cleaned[valid_idx[ok]] = values[ok].to_numpy(dtype=object)
+    # Shorthand rows always count as modified; plain rows only when the
+    # stripped string differs from the original
+    flags[valid_idx[ok]] = np.where(
+        is_million[ok],
+        True,
+        stripped[ok].to_numpy(dtype=object) != originals[ok].to_numpy(dtype=object),
+    )
 
-    
-    original = amount.strip()
+    return flags, cleaned
 
-    # Standardize to lowercase and remove common non-essential characters
-    amount_str = original.lower().strip()
-    
-    # Handle millions shorthand (e.g., 1.2m, 1.2 mil, 1.2 million)
-    if "m" in amount_str:
-        # Remove 'm', 'mil', 'million', and any surrounding whitespace
-        amount_str = re.sub(r"m|mil|million", "", amount_str).strip()
-        # Remove all other non-numeric characters except the decimal point
-        cleaned_amount_str = re.sub(r"[^\d.]", "", amount_str)
-        try:
-            # Convert to float and multiply by 1,000,000
-            return (True, float(cleaned_amount_str) * DEFAULT_UNIT)
-        except ValueError:
-            # Fallback: Fail to convert to float,return the original 
-            return (None, original)
-    
-    # Clean the string for numeric conversion
-    # This regex now correctly removes all non-digit and non-dot characters
-    cleaned_amount_str = re.sub(r"[^\d.]", "", amount_str)
-
-    # Handle cases with multiple decimal points
-    if cleaned_amount_str.count('.') > 1:
-        parts = cleaned_amount_str.split('.')
-        cleaned_amount_str = ''.join(parts[:-1]) + '.' + parts[-1]
-    
-    # Final conversion to float
+
+
+def _parse_date_fallback(value: str):
+    """
+    Flexible single-date parse for strings no known format matched.
+    dayfirst follows the AU convention used by the format list.
+    """
     try:
-        value = float(cleaned_amount_str)
-        
-        # Determine if the value was modified
-        was_modified = cleaned_amount_str != original
-        
-        return (was_modified, value)
-    except (ValueError, TypeError):
-        # Fallback: Fail to convert to float,return the original 
-        return (None, original)
-    
+        return dateutil_parser.parse(value, dayfirst=True)
+    except (ValueError, OverflowError, TypeError):
+        return pd.NaT
 
 
-def clean_date(date_str: str) -> Tuple[Optional[bool], Optional[str]]:
+def clean_dates(dates: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Cleans and standardizes a date string to a consistent 'YYYY-MM-DD' format.
-    
-    This version includes more common formats for better generalization.
-    
+    Cleans and standardizes a whole column of date strings to 'YYYY-MM-DD' format.
+
+    Instead of a strptime try/except loop per row, each known format gets one
+    vectorized `pd.to_datetime(..., format=fmt, errors="coerce")` pass over the
+    rows that are still unparsed, so a column dominated by a handful of formats
+    is resolved in a handful of C-level passes.
+
     Args:
-        date_str (str): The possibly messy date string.
-        
+        dates (pd.Series): The possibly messy date strings.
+
     Returns:
-        Tuple[Optional[bool], Optional[str]]: (was_modified, cleaned_date) or (None, original_input) if failed
+        Tuple[np.ndarray, np.ndarray]: (was_modified, cleaned_date) object arrays
+        aligned with the input; flag is None where parsing failed or the value
+        was missing.
     """
-    # Handle missing or invalid inputs
-    if pd.isna(date_str) or not isinstance(date_str, str) or not date_str.strip():
-        return (None, date_str)
-    
-    original = date_str.strip()
-    
+    n = len(dates)
+    raw = dates.to_numpy(dtype=object)
+    flags = np.full(n, None, dtype=object)
+    cleaned = raw.copy()
+
+    # Rows that are non-blank strings are eligible for parsing
+    valid = np.fromiter((isinstance(d, str) and bool(d.strip()) for d in raw), dtype=bool, count=n)
+    if not valid.any():
+        return flags, cleaned
+
+    originals = pd.Series([d.strip() for d in raw[valid]])
+    cleaned[valid] = originals.to_numpy(dtype=object)
+
     # Normalize separators to improve parsing consistency
     # Replace spaces, slashes, commas with dashes
-    date_str_clean = (
-        date_str.strip()
-        .replace(",", "")
-        .replace("/", "-")
-        .replace(" ", "-")
+    normalized = (
+        originals
+        .str.replace(",", "", regex=False)
+        .str.replace("/", "-", regex=False)
+        .str.replace(" ", "-", regex=False)
     )
 
-    # Attempt parsing against common procurement date formats
-    formats = [
-        "%Y-%m-%d",      # 2025-01-01 (ISO)
-        "%d-%m-%Y",      # 01-01-2025 (AU/EU)
-        "%m-%d-%Y",      # 01-25-2025 (US)
-        "%d-%b-%Y",      # 01-Jan-2025
-        "%d-%B-%Y",      # 01-January-2025
-        "%B-%d-%Y",      # January-01-2025
-        "%y-%m-%d"       # 25-01-01 (2-digit year)
-    ]
+    # One coercing pass per format, each over the still-unparsed rows only;
+    # format order decides ambiguous dates, same as the old per-row loop
+    parsed = pd.Series(pd.NaT, index=originals.index)
+    for fmt in _DATE_FORMATS:
+        pending = parsed.isna()
+        if not pending.any():
+            break
+        parsed[pending] = pd.to_datetime(normalized[pending], format=fmt, errors="coerce")
+
+    # Last resort for the stragglers: dateutil's flexible parser, row by row
+    # but only over whatever the vectorized format passes left behind
+    pending = parsed.isna()
+    if pending.any():
+        parsed[pending] = pd.to_datetime(
+            originals[pending].map(_parse_date_fallback), errors="coerce"
+        )
 
-    for fmt in formats:
-        try:
-            cleaned = datetime.strptime(date_str_clean, fmt).strftime("%Y-%m-%d")
-            if cleaned != original:
-                return (True, cleaned)
-            else:
-                return (False, original)
-        except ValueError:
-            continue
+    iso = parsed.dt.strftime("%Y-%m-%d")
+    ok = parsed.notna().to_numpy()
+    valid_idx = np.flatnonzero(valid)
+    iso_ok = iso[ok].to_numpy(dtype=object)
+    cleaned[valid_idx[ok]] = iso_ok
+    flags[valid_idx[ok]] = iso_ok != originals[ok].to_numpy(dtype=object)
 
-    return (None, original)
+    return flags, cleaned
 
 
 
-def clean_title(provider_clean: Optional[str], contract_title: Optional[str], contract_num: Optional[str], provider_to_contracts_dict: dict) -> Tuple[Optional[bool], Optional[str]]:
+def _contracts_lookup_df(provider_to_contracts_dict: dict) -> pd.DataFrame:
     """
-    Cleans and corrects ContractTitle for a single transaction row based on the provider name.
+    Flatten the provider -> contracts mapping into one lookup DataFrame with
+    Provider, ContractTitle, ContractNumber (as a stripped string) and the
+    provider's contract count, ready for hash joins against invoice columns.
+    """
+    records = [
+        {
+            "Provider": provider,
+            "ContractTitle": contract["contract_title"],
+            "ContractNumber": str(contract["contract_number"]).strip(),
+            "ContractNumberValue": contract["contract_number"],
+        }
+        for provider, contracts in provider_to_contracts_dict.items()
+        for contract in contracts
+    ]
+    lookup = pd.DataFrame(records)
+    # Object dtype keeps the seed's numbers as-is (ints stay ints) when they
+    # flow through maps/merges that introduce missing values
+    lookup["ContractNumberValue"] = lookup["ContractNumberValue"].astype(object)
+    lookup["ContractCount"] = lookup.groupby("Provider")["ContractTitle"].transform("size")
+    return lookup
+
+
+def clean_titles(providers: pd.Series, titles: pd.Series, numbers: pd.Series,
+                 provider_to_contracts_dict: dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cleans and corrects a whole column of ContractTitle values based on the provider name.
+
+    The provider -> contracts mapping is flattened once into a lookup frame,
+    then title validity and number-based title recovery are both resolved with
+    left merges on the whole column, instead of rebuilding a valid-title set
+    and scanning the contract list per row.
 
     Args:
-        provider_clean (str or None): Cleaned provider name from Provider_Clean column.
-        contract_title (str or None): Original ContractTitle value (may be empty or incorrect).
-        contract_num (str or None): Original ContractNumber value (may be empty or incorrect).
+        providers (pd.Series): Cleaned provider names from Provider_Clean.
+        titles (pd.Series): Original ContractTitle values (may be empty or incorrect).
+        numbers (pd.Series): Original ContractNumber values (may be empty or incorrect).
         provider_to_contracts_dict (dict): Mapping of provider -> list of contract dicts
                                            with keys 'contract_title' and 'contract_number'.
 
     Returns:
-        Tuple[Optional[bool], Optional[str]]: (was_modified, cleaned_title) or (None, original_input) if failed
+        Tuple[np.ndarray, np.ndarray]: (was_modified, cleaned_title) object arrays
+        aligned with the input; flag is None where the title could not be verified.
     """
-    # If title is empty and provider is missing or not in mapping, cannot fix anything
-    if (pd.isna(contract_title) or str(contract_title).strip() == "") and (provider_clean not in provider_to_contracts_dict):
-        return (None, contract_title)
-
-    contracts = provider_to_contracts_dict.get(provider_clean)
-    # When provider_clean is invalid, cant verify the given title
-    if not contracts:
-        return (None, contract_title)
-    
-    valid_titles = {contract["contract_title"] for contract in contracts}
-
-    #  Missing or mismatched title -> replace with contract with same contract number
-    if contract_title not in valid_titles:
-
-        # Contract number is missing, unable to match potential contract titke
-        if pd.isna(contract_num) or str(contract_num).strip() == "":
-            return (None, contract_title)
-        
-        # Apply if statement to improve efficiency for most of the cases
-        match_contract_len = len(contracts)
-        if match_contract_len == 1:
-            return (True, contracts[0]['contract_title'])
-        
-        if match_contract_len > 1:
-            for contract in contracts:
-                if str(contract['contract_number']) == contract_num.strip():
-                    return (True, contract['contract_title'])
-        
-        # Fallback: nothing match
-        return (None, contract_title)
-
-    return (False, contract_title)
-
-
-def clean_number(provider_clean: Optional[str], contract_number: Optional[str], title_clean: Optional[str], provider_to_contracts_dict: dict) -> Tuple[Optional[bool], Optional[str]]:
+    n = len(titles)
+    flags = np.full(n, None, dtype=object)
+    cleaned = titles.to_numpy(dtype=object).copy()
+    if not provider_to_contracts_dict:
+        return flags, cleaned
+
+    lookup = _contracts_lookup_df(provider_to_contracts_dict)
+
+    left = pd.DataFrame({
+        "Provider": providers.to_numpy(dtype=object),
+        "ContractTitle": cleaned,
+        "ContractNumber": numbers.to_numpy(dtype=object),
+    })
+
+    # Rows whose provider is unknown cannot be verified at all
+    contract_counts = left["Provider"].map(
+        lookup.drop_duplicates("Provider").set_index("Provider")["ContractCount"]
+    )
+    known = contract_counts.notna().to_numpy()
+
+    # A (provider, title) pair that joins the lookup is already valid
+    title_valid = left.merge(
+        lookup[["Provider", "ContractTitle"]].drop_duplicates(),
+        on=["Provider", "ContractTitle"], how="left", indicator=True,
+    )["_merge"].eq("both").to_numpy()
+
+    # Recovery needs a usable contract number
+    number_blank = (left["ContractNumber"].isna()
+                    | left["ContractNumber"].astype(str).str.strip().eq("")).to_numpy()
+    left["ContractNumber"] = left["ContractNumber"].astype(str).str.strip()
+
+    # Single-contract providers resolve to their only title regardless of the
+    # number's value; multi-contract providers resolve through a join on
+    # (provider, number), first contract winning on duplicates
+    single_titles = left["Provider"].map(
+        lookup[lookup["ContractCount"] == 1].set_index("Provider")["ContractTitle"]
+    )
+    number_titles = left.merge(
+        lookup[["Provider", "ContractNumber", "ContractTitle"]]
+        .drop_duplicates(["Provider", "ContractNumber"]),
+        on=["Provider", "ContractNumber"], how="left", suffixes=("", "_Lookup"),
+    )["ContractTitle_Lookup"]
+    recovered = np.where(contract_counts.to_numpy() == 1, single_titles, number_titles)
+
+    # Valid titles pass through unmodified; invalid ones are replaced when a
+    # recovery was found, otherwise they keep the original with a None flag
+    passthrough = known & title_valid
+    flags[passthrough] = False
+    replace = known & ~title_valid & ~number_blank & pd.notna(recovered)
+    flags[replace] = True
+    cleaned[replace] = recovered[replace]
+
+    return flags, cleaned
+
+
+def clean_numbers(providers: pd.Series, numbers: pd.Series, titles: pd.Series,
+                  provider_to_contracts_dict: dict) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Cleans and fills missing ContractNumber for a single transaction row.
+    Cleans and fills a whole column of ContractNumber values based on the provider name.
+
+    Mirror image of clean_titles: number validity and title-based number
+    recovery both resolve through merges against the flattened contract
+    lookup. This also retires the old per-row clean_number, which looked the
+    contract list up under the empty-string provider key and therefore never
+    verified or fixed anything.
 
     Args:
-        provider_clean (str or None): Cleaned provider name from Provider_Clean column.
-        contract_number (str or None): Original ContractNumber value (may be empty).
-        title_clean (str or None): Cleaned contract title from ContractTitle_Clean column.
+        providers (pd.Series): Cleaned provider names from Provider_Clean.
+        numbers (pd.Series): Original ContractNumber values (may be empty).
+        titles (pd.Series): Cleaned contract titles from ContractTitle_Clean.
         provider_to_contracts_dict (dict): Mapping of provider -> list of contract dicts
                                            with keys 'contract_title' and 'contract_number'.
 
     Returns:
-        Tuple[Optional[bool], Optional[str]]: (was_modified, cleaned_title) or (None, original_input) if failed
+        Tuple[np.ndarray, np.ndarray]: (was_modified, cleaned_number) object arrays
+        aligned with the input; flag is None where the number could not be verified.
     """
-    # If number is empty and provider is missing or not in mapping, cannot fix anything
-    if (pd.isna(contract_number) or str(contract_number).strip() == "") and (provider_clean not in provider_to_contracts_dict):
-        return (None, contract_number)
-    
-    contracts = provider_to_contracts_dict.get("")
-    # When provider_clean is invalid, cant verify the given number
-    if not contracts:
-        return (None, contract_number)
-
-    valid_nums = {contract["contract_number"] for contract in contracts}
-    
-    #  Missing or mismatched title -> replace with contract with same contract number
-    if contract_number not in valid_nums:
-
-        # Contract title is missing, unable to match potential contract number
-        if pd.isna(title_clean) or str(title_clean).strip() == "":
-            return (None, contract_number)
-        
-        #  Missing or mismatched title -> replace with contract with same contract title
-        match_contract_len = len(contracts)
-        if match_contract_len == 1:
-            return (True, contracts[0]['contract_number'])
-        
-        if match_contract_len > 1:
-            for contract in contracts:
-                if str(contract['contract_title']) == title_clean:
-                    return (True, contract['contract_number'])
+    n = len(numbers)
+    flags = np.full(n, None, dtype=object)
+    cleaned = numbers.to_numpy(dtype=object).copy()
+    if not provider_to_contracts_dict:
+        return flags, cleaned
+
+    lookup = _contracts_lookup_df(provider_to_contracts_dict)
+
+    left = pd.DataFrame({
+        "Provider": providers.to_numpy(dtype=object),
+        "ContractTitle": titles.to_numpy(dtype=object),
+    })
+    # Numbers are compared as stripped strings so ints, floats and text all
+    # line up against the contract seed
+    left["ContractNumber"] = numbers.astype(str).str.strip()
+
+    # Rows whose provider is unknown cannot be verified at all
+    contract_counts = left["Provider"].map(
+        lookup.drop_duplicates("Provider").set_index("Provider")["ContractCount"]
+    )
+    known = contract_counts.notna().to_numpy()
+
+    # A (provider, number) pair that joins the lookup is already valid
+    number_valid = left.merge(
+        lookup[["Provider", "ContractNumber"]].drop_duplicates(),
+        on=["Provider", "ContractNumber"], how="left", indicator=True,
+    )["_merge"].eq("both").to_numpy()
+
+    # Recovery needs a usable contract title
+    title_blank = (left["ContractTitle"].isna()
+                   | left["ContractTitle"].astype(str).str.strip().eq("")).to_numpy()
+
+    # Single-contract providers resolve to their only number regardless of
+    # the title's value; multi-contract providers resolve through a join on
+    # (provider, title), first contract winning on duplicates
+    single_numbers = left["Provider"].map(
+        lookup[lookup["ContractCount"] == 1].set_index("Provider")["ContractNumberValue"]
+    )
+    title_numbers = left.merge(
+        lookup[["Provider", "ContractTitle", "ContractNumberValue"]]
+        .drop_duplicates(["Provider", "ContractTitle"]),
+        on=["Provider", "ContractTitle"], how="left",
+    )["ContractNumberValue"]
+    recovered = np.where(contract_counts.to_numpy() == 1, single_numbers, title_numbers)
 
-        # Fallback: nothing match
-        return (None, contract_number)
+    # Valid numbers pass through unmodified; invalid ones are replaced when a
+    # recovery was found, otherwise they keep the original with a None flag
+    passthrough = known & number_valid
+    flags[passthrough] = False
+    replace = known & ~number_valid & ~title_blank & pd.notna(recovered)
+    flags[replace] = True
+    cleaned[replace] = recovered[replace]
 
-    return (False, contract_number)
+    return flags, cleaned
 
 
 
@@ -305,6 +511,52 @@ def clean_number(provider_clean: Optional[str], contract_number: Optional[str],
 # ETL Helper Functions
 # ---------------------------------------------------------------------------
 
+def _clean_unique(series: pd.Series, cleaner) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run a column cleaner over the distinct values only and broadcast the
+    results back to every row.
+
+    Messy batches repeat the same provider spellings, date strings and amount
+    formats many times over, so factorizing first means the cleaner (fuzzy
+    matching in particular) pays per distinct value instead of per row.
+
+    Args:
+        series (pd.Series): The raw column to clean.
+        cleaner: Column cleaner returning (flags, cleaned) arrays, e.g.
+                 clean_dates or a lambda closing over extra arguments.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (flags, cleaned) aligned with the input.
+    """
+    codes, uniques = pd.factorize(series)
+    unique_flags, unique_cleaned = cleaner(pd.Series(uniques, dtype=object))
+
+    # Missing values factorize to code -1; they keep the raw value with a
+    # None flag, exactly what every cleaner returns for them anyway
+    flags = np.full(len(series), None, dtype=object)
+    cleaned = series.to_numpy(dtype=object).copy()
+    seen = codes >= 0
+    flags[seen] = unique_flags[codes[seen]]
+    cleaned[seen] = unique_cleaned[codes[seen]]
+    return flags, cleaned
+
+
+def _arrow_safe(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Make every column Arrow-convertible before a Parquet write.
+
+    Failed cleans leave the original strings behind in otherwise numeric
+    *_Clean columns; any object column Arrow refuses is stored as strings
+    (missing values stay missing) and re-coerced by the readers.
+    """
+    for col in df.columns[df.dtypes == object]:
+        try:
+            pa.array(df[col])
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            df[col] = df[col].map(lambda v: None if pd.isna(v) else str(v))
+    return df
+
+
 def record_issue(
     df: pd.DataFrame, 
     failed_col: str = "FailedFields", 
@@ -329,46 +581,88 @@ def record_issue(
         pd.DataFrame: The DataFrame with updated FailedFields and ModifiedFields columns.
     """
 
-    # Initialize the failed_col as a list column, ensuring all rows are lists
-    if failed_col not in df.columns:
-        df[failed_col] = [[] for _ in range(len(df))]
-    else:
-        # Convert existing values to lists if they are not already
-        df[failed_col] = df[failed_col].apply(lambda x: x if isinstance(x, list) else [])
-
-    # Initialize the modified_col as a list column, ensuring all rows are lists
-    if modified_col not in df.columns:
-        df[modified_col] = [[] for _ in range(len(df))]
-    else:
-        # Convert existing values to lists if they are not already
-        df[modified_col] = df[modified_col].apply(lambda x: x if isinstance(x, list) else [])
-
-    # Find all columns ending with "_Flag" to determine which fields to process
+    # Find all columns ending with "_Flag" to determine which fields to process,
+    # and pull their values out as one rows x flags object matrix
     flag_cols = [c for c in df.columns if c.endswith("_Flag")]
-    for col in flag_cols:
-        # Derive the original field name by removing the "_Flag" suffix
-        field_name = col.replace("_Flag", "")
-
-        # Identify rows where the flag is None -> cleaning failed
-        failed_mask = df[col].isna()
-        # Append the field name to the failed_col list for these rows
-        df.loc[failed_mask, failed_col] = df.loc[failed_mask, failed_col].apply(
-            lambda issue_list: issue_list + [field_name]
-        )
+    field_names = [c.replace("_Flag", "") for c in flag_cols]
+    flags = df[flag_cols].to_numpy(dtype=object)
+
+    # Two boolean matrices answer every membership question at once:
+    # None/NaN flag -> cleaning failed, True flag -> field was modified
+    failed_matrix = pd.isna(flags)
+    modified_matrix = flags == True
+
+    for target_col, matrix in ((failed_col, failed_matrix), (modified_col, modified_matrix)):
+        # Keep any pre-existing lists in the column; everything else resets
+        if target_col in df.columns:
+            base = [x if isinstance(x, list) else [] for x in df[target_col]]
+        else:
+            base = [[] for _ in range(len(df))]
 
-        # Identify rows where the flag is True -> field was successfully modified automatically
-        modified_mask = df[col] == True
-        # Append the field name to the modified_col list for these rows
-        df.loc[modified_mask, modified_col] = df.loc[modified_mask, modified_col].apply(
-            lambda issue_list: issue_list + [field_name]
-        )
+        # Each row's list is built in a single comprehension pass instead of
+        # one masked .loc/.apply append per flag column
+        df[target_col] = [
+            existing + [name for name, hit in zip(field_names, row) if hit]
+            for existing, row in zip(base, matrix)
+        ]
 
     return df
 
+def transform_invoices(invoice_df: pd.DataFrame, provider_to_contracts_dict: dict) -> pd.DataFrame:
+    """
+    Transform one batch of raw invoices into its cleaned subset.
+
+    Runs the column cleaners and issue tracking over the given frame and
+    returns only the columns kept in the master cleaned dataset. Extracted
+    from etl_pipeline so the pipeline can stream a large CSV chunk by chunk.
+
+    Args:
+        invoice_df (pd.DataFrame): Raw transactions (one file or one chunk).
+        provider_to_contracts_dict (dict): Mapping of provider -> list of contract dicts.
+
+    Returns:
+        pd.DataFrame: Cleaned subset (InvoiceID, issue lists, *_Clean columns).
+    """
+    # --- Clean core columns ---
+    # Each cleaner runs over the distinct values only (see _clean_unique);
+    # repeated spellings and formats are resolved once and broadcast back
+    correct_providers = list(provider_to_contracts_dict.keys())
+    invoice_df["Provider_Flag"], invoice_df["Provider_Clean"] = _clean_unique(
+        invoice_df["Provider"], lambda s: clean_providers(s, correct_providers)
+    )
+
+    invoice_df["InvoiceAmount_Flag"], invoice_df["InvoiceAmount_Clean"] = _clean_unique(
+        invoice_df["InvoiceAmount"], clean_invoice_amounts
+    )
+
+    invoice_df["InvoiceDate_Flag"], invoice_df["InvoiceDate_Clean"] = _clean_unique(
+        invoice_df["InvoiceDate"], clean_dates
+    )
+
+    invoice_df["ContractTitle_Flag"], invoice_df["ContractTitle_Clean"] = clean_titles(
+        invoice_df["Provider_Clean"], invoice_df["ContractTitle"], invoice_df["ContractNumber"],
+        provider_to_contracts_dict
+    )
+
+    invoice_df["ContractNumber_Flag"], invoice_df["ContractNumber_Clean"] = clean_numbers(
+        invoice_df["Provider_Clean"], invoice_df["ContractNumber"], invoice_df["ContractTitle_Clean"],
+        provider_to_contracts_dict
+    )
+
+    # --- Track issues ---
+    invoice_df = record_issue(invoice_df)
+
+    cols_to_keep = ["InvoiceID", "FailedFields", "ModifiedFields"] + \
+                   [c for c in invoice_df.columns if c.endswith("_Clean")]
+
+    return invoice_df[cols_to_keep]
+
+
 def etl_pipeline(
     invoice_path: str,
     contract_path: str = DEFAULT_CONTRACT_PATH,
-    master_cleaned_path: str = DEFAULT_CLEANED_PATH
+    master_cleaned_path: str = DEFAULT_CLEANED_PATH,
+    chunk_size: int = DEFAULT_CHUNK_SIZE
 ) -> pd.DataFrame:
     """
     ETL Pipeline for Procurement Transactions.
@@ -377,14 +671,23 @@ def etl_pipeline(
     procurement transactions CSV file and appends the cleaned results into a
     rolling master dataset.
 
+    The raw file is streamed through pd.read_csv(chunksize=...), so peak
+    memory is bounded by the chunk size (plus the cleaning intermediates for
+    one chunk) rather than the full file plus every derived column. Chunks
+    are cleaned in parallel worker processes, since each one is independent
+    and the fuzzy matching is CPU-bound.
+
     Args:
         invoice_path (str):
             Path to raw transactions CSV file (simulated_transactions_*.csv).
         contract_path (str):
             Path to contract dataset JSON (default: DEFAULT_CONTRACT_PATH).
         master_cleaned_path (str):
-            File path for rolling cleaned dataset. If file exists, new data
-            will be appended; otherwise, file will be created.
+            Directory of the rolling cleaned Parquet dataset. Each run adds
+            new files under its IngestDate=... partition; nothing existing
+            is rewritten.
+        chunk_size (int):
+            Number of raw rows processed per chunk (default: DEFAULT_CHUNK_SIZE).
 
     Returns:
         pd.DataFrame:
@@ -394,58 +697,34 @@ def etl_pipeline(
 
     print(f"Running ETL for {invoice_path}...")
 
-    # --- Step 1: Load data ---
-    invoice_df = load_csv_data_df(invoice_path)
-    provider_to_contracts_dict = get_provider_to_contracts_dict(contract_path)
+    if not os.path.exists(invoice_path):
+        print(f"Error: The file {invoice_path} was not found.")
+        return pd.DataFrame()
 
-    # --- Step 2: Clean core columns ---
-    invoice_df[["Provider_Flag", "Provider_Clean"]] = invoice_df["Provider"].apply(
-        lambda x: pd.Series(clean_provider(x, list(provider_to_contracts_dict.keys())))
-    )
-
-    invoice_df[["InvoiceAmount_Flag", "InvoiceAmount_Clean"]] = invoice_df["InvoiceAmount"].apply(
-        lambda x: pd.Series(clean_invoice_amount(x))
-    )
-
-    invoice_df[["InvoiceDate_Flag", "InvoiceDate_Clean"]] = invoice_df["InvoiceDate"].apply(
-        lambda x: pd.Series(clean_date(x))
-    )
+    provider_to_contracts_dict = get_provider_to_contracts_dict(contract_path)
 
-    invoice_df[["ContractTitle_Flag", "ContractTitle_Clean"]] = invoice_df.apply(
-        lambda row: pd.Series(clean_title(
-            row["Provider_Clean"],
-            row["ContractTitle"],
-            row["ContractNumber"],
-            provider_to_contracts_dict
-        )),
-        axis=1
+    # Stream the raw file chunk by chunk and clean the chunks on all cores:
+    # each chunk is independent, the fuzzy matching dominates the cost, and
+    # loky sidesteps the GIL for it. Parallel preserves chunk order. The
+    # pyarrow backend keeps the string-heavy raw columns in Arrow buffers
+    # instead of per-row Python objects while chunks wait their turn
+    cleaned_chunks = Parallel(n_jobs=-1, backend="loky")(
+        delayed(transform_invoices)(chunk, provider_to_contracts_dict)
+        for chunk in pd.read_csv(invoice_path, chunksize=chunk_size, dtype_backend="pyarrow")
     )
-
-    invoice_df[["ContractNumber_Flag", "ContractNumber_Clean"]] = invoice_df.apply(
-        lambda row: pd.Series(clean_number(
-            row["Provider_Clean"],
-            row["ContractNumber"],
-            row["ContractTitle_Clean"],
-            provider_to_contracts_dict
-        )),
-        axis=1
+    if not cleaned_chunks:
+        return pd.DataFrame()
+    cleaned_subset = pd.concat(cleaned_chunks, ignore_index=True)
+
+    # Append to the master Parquet dataset: each run lands as new files under
+    # its IngestDate partition, so "append" never rereads or rewrites what
+    # earlier runs produced (unlike the old rolling-CSV append), and readers
+    # can prune whole partitions by date
+    cleaned_subset["IngestDate"] = pd.Timestamp.now().strftime("%Y-%m-%d")
+    _arrow_safe(cleaned_subset).to_parquet(
+        master_cleaned_path, partition_cols=["IngestDate"], index=False
     )
-
-    # --- Step 3: Track issues ---
-    invoice_df = record_issue(invoice_df)
-
-    # --- Step 4: Append cleaned data ---
-    cols_to_keep = ["InvoiceID", "FailedFields", "ModifiedFields"] + \
-                   [c for c in invoice_df.columns if c.endswith("_Clean")]
-
-    cleaned_subset = invoice_df[cols_to_keep]
-
-    if os.path.exists(master_cleaned_path):
-        cleaned_subset.to_csv(master_cleaned_path, mode="a", header=False, index=False)
-        print(f"Appended cleaned data to {master_cleaned_path}")
-    else:
-        cleaned_subset.to_csv(master_cleaned_path, mode="w", header=True, index=False)
-        print(f"Created {master_cleaned_path} with first batch of cleaned data")
+    print(f"Appended cleaned data to {master_cleaned_path}")
 
     return cleaned_subset
 
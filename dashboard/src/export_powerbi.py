@@ -2,7 +2,8 @@
 Export Power BI Module
 
 This module consolidates outputs from ETL, risk scoring, contract summary,
-and analysis into curated CSVs with stable schemas for Power BI dashboards.
+and analysis into curated CSVs (each with a Parquet sibling) with stable
+schemas for Power BI dashboards.
 
 Responsibilities:
     1. Load intermediate outputs (cleaned invoices, risk scores, summaries, forecasts, KPIs, scenarios).
@@ -24,7 +25,7 @@ Final Outputs:
 import pandas as pd
 import os
 from constants import *
-from utils import load_csv_data_df
+from utils import load_csv_data_df, load_parquet_data_df
 
 
 # --- Utility functions ---
@@ -38,7 +39,15 @@ def validate_columns(df: pd.DataFrame, required: list, name: str) -> pd.DataFram
 
 
 def export_curated(df: pd.DataFrame, path: str, order: list | None = None):
-    """Save curated CSV with column order enforced if provided."""
+    """
+    Save a curated dataset with column order enforced if provided.
+
+    Each dataset is written twice: the CSV Power BI already consumes, plus a
+    Parquet sibling (same name, .parquet extension). Power BI reads Parquet
+    natively, and the columnar writer skips per-cell text formatting, so
+    dashboards can be repointed at the faster format without breaking the
+    existing CSV wiring.
+    """
     if df.empty:
         print(f"[Warning] No data to export for {path}")
         return
@@ -47,20 +56,29 @@ def export_curated(df: pd.DataFrame, path: str, order: list | None = None):
         df = df[existing_cols]
     os.makedirs(os.path.dirname(path), exist_ok=True)
     df.to_csv(path, index=False)
+
+    parquet_path = os.path.splitext(path)[0] + ".parquet"
+    try:
+        df.to_parquet(parquet_path, index=False)
+    except Exception as e:
+        # A column with mixed leftover types (e.g. failed cleans) can refuse
+        # Arrow conversion; the CSV is still written, so just warn
+        print(f"[Warning] Could not write Parquet copy {parquet_path}. {e}")
+
     print(f"Exported curated dataset: {path}")
 
 
 # --- Main workflow ---
 def main():
     # 1. Load raw outputs
-    cleaned = load_csv_data_df(DEFAULT_CLEANED_PATH)
+    cleaned = load_parquet_data_df(DEFAULT_CLEANED_PATH)
     risks = load_csv_data_df(DEFAULT_RISK_PATH)
-    annual = load_csv_data_df(DEFAULT_SUMMARY_ANNUAL_PATH)
-    monthly = load_csv_data_df(DEFAULT_SUMMARY_MONTHLY_PATH)
-    monthly_forecast = load_csv_data_df(DEFAULT_ANALYSIS_MONTHLY_FORECAST_PATH)
-    annual_forecast = load_csv_data_df(DEFAULT_ANALYSIS_ANNUAL_FORECAST_PATH)
-    kpis = load_csv_data_df(DEFAULT_ANALYSIS_KPIS_PATH)
-    scenario = load_csv_data_df(DEFAULT_ANALYSIS_SCENARIO_PATH)
+    annual = load_parquet_data_df(DEFAULT_SUMMARY_ANNUAL_PATH)
+    monthly = load_parquet_data_df(DEFAULT_SUMMARY_MONTHLY_PATH)
+    monthly_forecast = load_parquet_data_df(DEFAULT_ANALYSIS_MONTHLY_FORECAST_PATH)
+    annual_forecast = load_parquet_data_df(DEFAULT_ANALYSIS_ANNUAL_FORECAST_PATH)
+    kpis = load_parquet_data_df(DEFAULT_ANALYSIS_KPIS_PATH)
+    scenario = load_parquet_data_df(DEFAULT_ANALYSIS_SCENARIO_PATH)
 
     # 2. Validate essential columns
     cleaned = validate_columns(
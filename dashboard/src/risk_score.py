@@ -13,10 +13,12 @@ Output:
     - risk_scored_invoices.csv (invoice-level risks)
 """
 
+import ast
+
 import pandas as pd
 import numpy as np
 from constants import DEFAULT_CLEANED_PATH, DEFAULT_CONTRACT_PATH, DEFAULT_RISK_PATH
-from utils import load_csv_data_df, load_json_data_list
+from utils import load_json_data_list, load_parquet_data_df
 
 # --- Risk weights ---
 FAILED_WEIGHTS = {
@@ -50,106 +52,140 @@ HIGH_AMOUNT_THRESHOLD = 1000000
 LOW_AMOUNT_THRESHOLD = 100
 
 
-def safe_float(x):
-    """Convert to float safely; return NaN if invalid."""
-    try:
-        return float(x)
-    except (TypeError, ValueError):
-        return np.nan
+def _parse_field_list(value) -> list:
+    """
+    Return a field-name list from whatever the issue columns hold.
 
+    The lists survive the CSV round trip as their string repr
+    (e.g. "['Provider', 'InvoiceDate']"), so strings are parsed back;
+    real lists/arrays pass through and missing values become empty.
+    """
+    if isinstance(value, str):
+        try:
+            parsed = ast.literal_eval(value)
+            return list(parsed) if isinstance(parsed, (list, tuple)) else []
+        except (ValueError, SyntaxError):
+            return []
+    if value is None or (isinstance(value, float) and np.isnan(value)):
+        return []
+    return list(value)
+
+
+def _fields_risk(fields: pd.Series, weights: dict, default_weight: int) -> np.ndarray:
+    """
+    Sum the per-field weights for a whole column of field-name lists.
 
-def safe_date(x):
-    """Convert to datetime safely; return NaT if invalid."""
-    try:
-        return pd.to_datetime(x, errors="coerce")
-    except Exception:
-        return pd.NaT
+    The lists are exploded once, the weights resolved with vectorized maps
+    (falling back to the short key without the Contract prefix, then to the
+    default weight), and summed back per row.
+    """
+    exploded = fields.map(_parse_field_list).explode().dropna()
+    if exploded.empty:
+        return np.zeros(len(fields), dtype=np.int64)
+
+    base = (
+        exploded.astype(str)
+        .str.replace("_Clean", "", regex=False)
+        .str.replace("_Flag", "", regex=False)
+    )
+    # Weight keys use the short names (Title, Number) for the contract fields
+    resolved = base.map(weights)
+    resolved = resolved.fillna(base.str.replace("Contract", "", regex=False).map(weights))
+    resolved = resolved.fillna(default_weight)
+
+    return (
+        resolved.groupby(level=0).sum()
+        .reindex(fields.index, fill_value=0)
+        .to_numpy(dtype=np.int64)
+    )
 
 
-def compute_risk_score(row: pd.Series, contract_map: dict) -> dict:
-    """
-    Compute detailed risk components and overall score for a single row.
-    Handles invalid/missing inputs safely.
+def add_risk_scores(df: pd.DataFrame, contracts: list) -> pd.DataFrame:
     """
-    data_quality_risk = 0
-    contract_risk = 0
-    financial_risk = 0
+    Apply risk scoring across dataset, fully vectorized.
 
+    Data quality risk is summed from the exploded issue lists, contract
+    compliance joins the contract seed in one merge on the supplier-contract
+    keys, and the financial bands fall out of a single np.select — no per-row
+    apply anywhere.
+    """
     # --- Data Quality Risks ---
-    failed_fields = row.get("FailedFields", []) or []
-    modified_fields = row.get("ModifiedFields", []) or []
-
-    for field in failed_fields:
-        base = str(field).replace("_Clean", "").replace("_Flag", "").capitalize()
-        data_quality_risk += FAILED_WEIGHTS.get(base, 5)
+    data_quality_risk = (
+        _fields_risk(df.get("FailedFields", pd.Series(index=df.index, dtype=object)),
+                     FAILED_WEIGHTS, 5)
+        + _fields_risk(df.get("ModifiedFields", pd.Series(index=df.index, dtype=object)),
+                       MODIFIED_WEIGHTS, 2)
+    )
 
-    for field in modified_fields:
-        base = str(field).replace("_Clean", "").replace("_Flag", "").capitalize()
-        data_quality_risk += MODIFIED_WEIGHTS.get(base, 2)
-
-    # --- Extract key fields ---
-    provider = row.get("Provider_Clean")
-    title = row.get("ContractTitle_Clean")
-    number = row.get("ContractNumber_Clean")
+    # --- Contract Compliance Risks ---
+    # One left merge against the contract seed replaces the per-row dict
+    # lookups; contract numbers are compared as stripped strings so the
+    # match works whether the column came back as ints, floats or text
+    contracts_df = pd.DataFrame([
+        {
+            "Provider_Clean": c.get("service_provider"),
+            "ContractTitle_Clean": c.get("contract_title"),
+            "_NumberKey": str(c.get("contract_number")).strip(),
+            "_ExpiryDate": c.get("expiry_date"),
+        }
+        for c in contracts
+        if c.get("service_provider") and c.get("contract_title")
+    ])
 
-    amount = safe_float(row.get("InvoiceAmount_Clean"))
-    inv_date = safe_date(row.get("InvoiceDate_Clean"))
+    key_cols = ["Provider_Clean", "ContractTitle_Clean", "_NumberKey"]
+    left = df[["Provider_Clean", "ContractTitle_Clean"]].copy()
+    left["_NumberKey"] = df["ContractNumber_Clean"].astype(str).str.strip()
 
-    # --- Contract Compliance Risks ---
-    key = (provider, title, number)
-    contract = contract_map.get(key)
-
-    if contract:
-        expiry_raw = contract.get("expiry_date")
-        expiry = safe_date(expiry_raw)
-
-        if pd.notna(expiry) and pd.notna(inv_date):
-            if inv_date > expiry:
-                contract_risk += CONTRACT_WEIGHTS["Expired"]
-            elif 0 <= (expiry - inv_date).days <= 90:
-                contract_risk += CONTRACT_WEIGHTS["ExpiringSoon"]
+    if contracts_df.empty:
+        matched = np.zeros(len(df), dtype=bool)
+        expiry = pd.Series(pd.NaT, index=df.index)
     else:
-        contract_risk += CONTRACT_WEIGHTS["ContractMismatch"]
+        contracts_df = contracts_df.drop_duplicates(subset=key_cols, keep="last")
+        merged = left.merge(contracts_df, on=key_cols, how="left", indicator=True)
+        matched = merged["_merge"].eq("both").to_numpy()
+        expiry = pd.to_datetime(merged["_ExpiryDate"], errors="coerce")
+
+    inv_date = pd.to_datetime(df["InvoiceDate_Clean"], errors="coerce")
+    days_left = (expiry.to_numpy() - inv_date.to_numpy()) / np.timedelta64(1, "D")
+
+    # NaT on either side makes the comparisons False, so unknown dates
+    # contribute no expiry risk — same as the old per-row guards
+    contract_risk = np.select(
+        [
+            ~matched,
+            inv_date.to_numpy() > expiry.to_numpy(),
+            (days_left >= 0) & (days_left <= 90),
+        ],
+        [
+            CONTRACT_WEIGHTS["ContractMismatch"],
+            CONTRACT_WEIGHTS["Expired"],
+            CONTRACT_WEIGHTS["ExpiringSoon"],
+        ],
+        default=0,
+    )
 
     # --- Financial Risks ---
-    if pd.notna(amount):
-        if amount > HIGH_AMOUNT_THRESHOLD:
-            financial_risk += FINANCIAL_WEIGHTS["HighAmount"]
-        elif amount < LOW_AMOUNT_THRESHOLD:
-            financial_risk += FINANCIAL_WEIGHTS["LowAmount"]
-
-    total_score = data_quality_risk + contract_risk + financial_risk
-
-    return {
-        "RiskScore": total_score,
-        "DataQualityRisk": data_quality_risk,
-        "ContractRisk": contract_risk,
-        "FinancialRisk": financial_risk,
-    }
-
-
-def add_risk_scores(df: pd.DataFrame, contracts: list) -> pd.DataFrame:
-    """
-    Apply risk scoring across dataset.
-    """
-    # Build contract lookup map
-    contract_map = {
-        (c.get("service_provider"), c.get("contract_title"), c.get("contract_number")): c
-        for c in contracts
-        if c.get("service_provider") and c.get("contract_title")
-    }
+    amount = pd.to_numeric(df["InvoiceAmount_Clean"], errors="coerce").to_numpy()
+    financial_risk = np.select(
+        [amount > HIGH_AMOUNT_THRESHOLD, amount < LOW_AMOUNT_THRESHOLD],
+        [FINANCIAL_WEIGHTS["HighAmount"], FINANCIAL_WEIGHTS["LowAmount"]],
+        default=0,
+    )
 
-    risk_dicts = df.apply(lambda row: compute_risk_score(row, contract_map), axis=1)
-    risk_df = pd.DataFrame(list(risk_dicts))
-    return pd.concat([df.reset_index(drop=True), risk_df], axis=1)
+    df = df.reset_index(drop=True)
+    df["RiskScore"] = data_quality_risk + contract_risk + financial_risk
+    df["DataQualityRisk"] = data_quality_risk
+    df["ContractRisk"] = contract_risk
+    df["FinancialRisk"] = financial_risk
+    return df
 
 
 def main(cleaned_path: str = DEFAULT_CLEANED_PATH, contract_path: str = DEFAULT_CONTRACT_PATH, output_path: str = DEFAULT_RISK_PATH):
     """
     Run risk scoring pipeline end-to-end.
     """
-    # Load cleaned transactions
-    df = load_csv_data_df(cleaned_path)
+    # Load cleaned transactions (partitioned Parquet dataset from etl.py)
+    df = load_parquet_data_df(cleaned_path)
 
     # Load contract seed
     contracts = load_json_data_list(contract_path)
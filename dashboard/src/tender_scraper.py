@@ -1,20 +1,26 @@
 """
 Procurement Contract Scraper
 
-This module uses Selenium WebDriver to scrape tender data from the City of Melbourne website. 
-It extracts structured information about contracts, 
+This module scrapes tender data from the City of Melbourne website.
+It extracts structured information about contracts,
 including contract title, service provider, contract number, contract's annual value, and expiry dates.
 The scraped data is used as a "seed dataset" for simulating procurement transactions later in the pipeline.
 
 Workflow:
-    1. Open the City of Melbourne procurement webpage with Selenium.
-    2. Locate and parse the tender table.
+    1. Fetch the City of Melbourne procurement page with a plain HTTP GET
+       and parse the tender table with BeautifulSoup (the table is
+       server-rendered, so no browser is needed in the common case).
+    2. Fall back to Selenium WebDriver only if the table is missing from
+       the static HTML (e.g. the site starts rendering it client-side).
     3. Extract fields: title, supplier, contract number, annual value, expiry date.
     4. Convert "annual value" ranges into numeric lower and upper bounds.
     5. Save data into a structured list of `Contract` objects.
     6. Dump saved Contract data into a json file.
 """
 
+import requests
+from bs4 import BeautifulSoup
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
@@ -22,17 +28,60 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, asdict
 from typing import Optional
 
-import json
+import orjson
+import functools
+import os
+import re
+import sys
 from pathlib import Path
 
-from constants import DEFAULT_CONTRACT_PATH, DEFAULT_UNIT
+from constants import DATA_DIR, DEFAULT_CONTRACT_PATH, DEFAULT_UNIT
+
 
+@functools.lru_cache(maxsize=1)
+def _chromedriver_path() -> str:
+    """
+    Resolve the ChromeDriver binary once per process.
+
+    A CHROMEDRIVER_PATH environment variable short-circuits the lookup
+    entirely (useful on CI images with a preinstalled driver); otherwise
+    ChromeDriverManager().install() checks the driver version over the
+    network, so repeated scrapes reuse the first resolution instead of
+    paying that round-trip every call.
+    """
+    env_path = os.environ.get("CHROMEDRIVER_PATH")
+    if env_path:
+        return env_path
+    return ChromeDriverManager().install()
+
+
+def _chrome_options() -> webdriver.ChromeOptions:
+    """
+    Build the Chrome options used for scraping: headless, no GPU, images
+    disabled, and eager page loads so control returns as soon as the DOM is
+    parseable instead of after every asset has rendered.
+    """
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.page_load_strategy = "eager"
+    return options
+
+@dataclass(slots=True)
 class Contract:
     """
-    A class to represent a government contract with specific details.
-    
+    A government contract with specific details.
+
+    Declared with slots so thousands of scraped contracts store their
+    fields in a fixed layout instead of one per-instance __dict__ each.
+
     Attributes:
         contract_title (str): The title of the contract.
         service_provider (str): The name of the company awarded the contract.
@@ -42,50 +91,42 @@ class Contract:
         expiry_date (str): The contract's expiry date as text.
     """
 
-    def __init__(self, contract_title: str, service_provider: str, contract_number: int,
-                annual_value_lower_bound: Optional[int] , annual_value_upper_bound: Optional[int], expiry_date: str):
-        """
-        Initializes a new Contract object.
-
-        Args:
-            contract_title (str): Title of the contract.
-            service_provider (str): Supplier or company name.
-            contract_number (str): Unique identifier for the contract.
-            annual_value_lower_bound (int/None): Lower bound in AUD (if available).
-            annual_value_upper_bound (int/None): Upper bound in AUD (if available).
-            expiry_date (str): Expiry date as string from source site.
-        """
-        self.contract_title = contract_title
-        self.service_provider = service_provider
-        self.contract_number = contract_number
-        self.annual_value_lower_bound = annual_value_lower_bound
-        self.annual_value_upper_bound = annual_value_upper_bound
-        self.expiry_date = expiry_date
-
-    def __repr__(self):
-        """
-        String representation of the Contract object.
-        Useful for debugging and quick inspection.
-        """
-        return (f"Contract(contract_title='{self.contract_title}', "
-                f"service_provider='{self.service_provider}', "
-                f"contract_number='{self.contract_number}', "
-                f"annual_value_lower_bound='{self.annual_value_lower_bound}', "
-                f"annual_value_upper_bound='{self.annual_value_upper_bound}', "
-                f"expiry_date='{self.expiry_date}')")
+    contract_title: str
+    service_provider: str
+    contract_number: str
+    annual_value_lower_bound: Optional[int]
+    annual_value_upper_bound: Optional[int]
+    expiry_date: str
 
     def to_dict(self) -> dict:
         """
         Convert Contract object to a dictionary for JSON serialization.
         """
-        return {
-            "contract_title": self.contract_title,
-            "service_provider": self.service_provider,
-            "contract_number": self.contract_number,
-            "annual_value_lower_bound": self.annual_value_lower_bound,
-            "annual_value_upper_bound": self.annual_value_upper_bound,
-            "expiry_date": self.expiry_date
-        }
+        return asdict(self)
+
+# Matches every annual-value shape the page uses in one pass:
+# "$1 to 2 million", "$2.5 million to $3.5 million", "Above $2 million"
+# and "$3 million"; the first "million" is optional so ranges that repeat
+# the unit on both bounds still capture the upper bound
+_ANNUAL_VALUE_RE = re.compile(
+    r"(Above\s+)?\$?\s*(\d+(?:\.\d+)?)(?:\s*million)?"
+    r"(?:\s*to\s*\$?\s*(\d+(?:\.\d+)?))?\s*million",
+    re.IGNORECASE,
+)
+
+
+def _to_aud(number_str: str, unit: int) -> int:
+    """
+    Scale a matched number string by the unit.
+
+    Whole-number values (the overwhelming majority on the page) stay in
+    exact integer arithmetic; only values with a decimal point go through
+    float.
+    """
+    if '.' not in number_str:
+        return int(number_str) * unit
+    return int(float(number_str) * unit)
+
 
 def parse_annual_value(value_str:str, unit:int = DEFAULT_UNIT) -> tuple:
     """
@@ -104,97 +145,194 @@ def parse_annual_value(value_str:str, unit:int = DEFAULT_UNIT) -> tuple:
         tuple: (lower_bound, upper_bound) as integers in AUD,
                or (None, None) if parsing fails.
     """
-    clean_str = value_str.replace('$', '').replace('million', '').strip()
-    lower_bound, upper_bound = None, None
+    # fullmatch anchors the pattern to the whole cell: a stray substring
+    # match (e.g. inside "Up to $1 million" or "$500,000 to $1 million")
+    # must stay a parse failure, not fabricate bounds
+    match = _ANNUAL_VALUE_RE.fullmatch(value_str.strip())
+    if match is None:
+        return None, None
 
-    if 'to' in clean_str:
-        # Range case: "$1 to 2 million"
-        try:
-            parts = clean_str.split(' to ')
-            lower_bound = int(float(parts[0]) * unit)
-            upper_bound = int(float(parts[1]) * unit)
-        except (ValueError, IndexError):
-            pass
-
-    elif 'Above' in clean_str:
+    above, lower_str, upper_str = match.groups()
+    lower_bound = _to_aud(lower_str, unit)
+
+    if above:
         # Open-ended range: "Above $2 million"
-        try:
-            number_str = clean_str.replace('Above', '').strip()
-            lower_bound = int(float(number_str) * unit)
-            upper_bound = None
-        except ValueError:
-            pass
+        return lower_bound, None
+    if upper_str:
+        # Range case: "$1 to 2 million"
+        return lower_bound, _to_aud(upper_str, unit)
+    # Single fixed value: "$3 million"
+    return lower_bound, lower_bound
 
-    else:
-        # Single fixed value: "$3 million"
-        try:
-            value = int(float(clean_str) * unit)
-            lower_bound, upper_bound = value, value
-        except ValueError:
-            pass
 
-    return lower_bound, upper_bound
+def _fetch_rows_static(url: str) -> Optional[list]:
+    """
+    Fetch the tender table from the static HTML, without a browser.
 
+    Args:
+        url (str): URL of the procurement page.
 
-def scrape(url: str ="https://www.melbourne.vic.gov.au/current-contracts-and-future-tenders"):
+    Returns:
+        list[list[str]]/None: Cell text per table row, or None if the page
+        could not be fetched or contains no tender table (caller should
+        fall back to Selenium).
     """
-    Scrapes contracts and tenders from the City of Melbourne procurement page.
+    try:
+        response = requests.get(url, timeout=10)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"Static fetch failed ({e}), falling back to Selenium.")
+        return None
+
+    soup = BeautifulSoup(response.text, "html.parser")
+    tender_table = soup.select_one(".cb-table")
+    if tender_table is None:
+        print("No tender table in static HTML, falling back to Selenium.")
+        return None
+
+    rows = [
+        [cell.get_text(strip=True) for cell in row.find_all("td")]
+        for row in tender_table.find_all("tr")
+    ]
+
+    # An empty table shell (header only, rows rendered client-side) is the
+    # very case the browser fallback exists for — treat it like no table
+    if not any(rows):
+        print("Tender table has no data rows in static HTML, falling back to Selenium.")
+        return None
+
+    return rows
+
+
+def _new_driver() -> webdriver.Remote:
+    """
+    Start a headless browser, local by default.
+
+    If SELENIUM_GRID_URL is set, sessions are opened against that Selenium
+    Grid instead, which lets concurrent scrapes fan out across the grid's
+    nodes rather than all launching local Chrome processes.
+    """
+    grid_url = os.environ.get("SELENIUM_GRID_URL")
+    if grid_url:
+        return webdriver.Remote(command_executor=grid_url, options=_chrome_options())
+    # Set up Selenium with the cached ChromeDriver, headless
+    return webdriver.Chrome(service=Service(_chromedriver_path()), options=_chrome_options())
+
+
+def _fetch_rows_selenium(url: str) -> list:
+    """
+    Fetch the tender table with a headless browser.
+
+    Used only when the static fetch cannot find the table, e.g. if the
+    site moves to client-side rendering.
 
     Args:
-        url (str, optional): URL of the procurement page. Defaults to Melbourne tenders page.
+        url (str): URL of the procurement page.
 
     Returns:
-        list[Contract]: List of Contract objects with extracted details.
+        list[list[str]]: Cell text per table row.
     """
-    # Set up Selenium with ChromeDriver
-    driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-    contract_list = []
+    driver = _new_driver()
 
     try:
         print(f"Opening browser and navigating to {url}")
         driver.get(url)
 
-        # Wait for tender table to
-        tender_table = WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((By.CLASS_NAME, 'cb-table'))
+        # Wait for the table rows themselves: the bare table element can be
+        # in the DOM before its rows are rendered, which would make the
+        # extraction below silently return an empty list
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_all_elements_located((By.CSS_SELECTOR, '.cb-table tr'))
         )
-        rows = tender_table.find_elements(By.TAG_NAME, "tr")
 
-        for row in rows:
-            cols = row.find_elements(By.TAG_NAME, "td")
-
-            # Expecting 5 columns: Title, Supplier, Number, Value, Expiry
-            if len(cols) == 5:
-                contract_title = cols[0].text.strip()
-                service_provider = cols[1].text.strip()
-                contract_number = cols[2].text.strip()
-                annual_value_lower_bound, annual_value_upper_bound = parse_annual_value(cols[3].text.strip())
-                expiry_date = cols[4].text.strip()
-
-                # Create Contract object and append to list
-                contract = Contract(
-                    contract_title, service_provider, contract_number,
-                    annual_value_lower_bound, annual_value_upper_bound, expiry_date
-                )
-                contract_list.append(contract)
-
-        if contract_list:
-            print(f"Successfully scraped {len(contract_list)} contracts.")
+        # Pull the whole table in one JavaScript call: each find_elements /
+        # .text access is a separate WebDriver round-trip, which dominates
+        # scrape time on a table of any size
+        return driver.execute_script(
+            "return Array.from(document.querySelectorAll('.cb-table tr'))"
+            ".map(r => Array.from(r.querySelectorAll('td'))"
+            ".map(c => c.innerText.trim()));"
+        )
 
     finally:
         # Ensure browser closes even if scraping fails
         driver.quit()
 
+
+def scrape(url: str ="https://www.melbourne.vic.gov.au/current-contracts-and-future-tenders",
+           as_dicts: bool = False):
+    """
+    Scrapes contracts and tenders from the City of Melbourne procurement page.
+
+    Tries a plain HTTP fetch first and only spins up a browser if the
+    tender table is not present in the static HTML.
+
+    Args:
+        url (str, optional): URL of the procurement page. Defaults to Melbourne tenders page.
+        as_dicts (bool, optional): Return plain dicts instead of Contract
+            objects, so callers that only serialize the data skip the
+            object-then-to_dict round trip. Defaults to False.
+
+    Returns:
+        list[Contract]/list[dict]: Extracted contract details.
+    """
+    rows = _fetch_rows_static(url)
+    if rows is None:
+        rows = _fetch_rows_selenium(url)
+
+    contract_list = []
+
+    for cols in rows:
+        # Expecting 5 columns: Title, Supplier, Number, Value, Expiry
+        if len(cols) == 5:
+            annual_value_lower_bound, annual_value_upper_bound = parse_annual_value(cols[3])
+
+            # Providers and expiry dates repeat across many rows; interning
+            # collapses the duplicates to one shared string object each
+            record = {
+                "contract_title": cols[0],
+                "service_provider": sys.intern(cols[1]),
+                "contract_number": cols[2],
+                "annual_value_lower_bound": annual_value_lower_bound,
+                "annual_value_upper_bound": annual_value_upper_bound,
+                "expiry_date": sys.intern(cols[4]),
+            }
+            contract_list.append(record if as_dicts else Contract(**record))
+
+    if contract_list:
+        print(f"Successfully scraped {len(contract_list)} contracts.")
+
     return contract_list
 
+def scrape_many(urls: list, max_workers: int = 5, as_dicts: bool = False) -> list:
+    """
+    Scrape several procurement pages concurrently.
+
+    The work is network-bound (HTTP fetches, or browser sessions in the
+    fallback), so a thread pool overlaps the waiting instead of visiting
+    the pages one after another.
+
+    Args:
+        urls (list[str]): Procurement page URLs to scrape.
+        max_workers (int, optional): Thread pool size. Defaults to 5.
+        as_dicts (bool, optional): Forwarded to scrape(). Defaults to False.
+
+    Returns:
+        list[list]: One result list per URL, in input order.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda u: scrape(u, as_dicts=as_dicts), urls))
+
+
 if __name__ == "__main__":
-    Path("data").mkdir(exist_ok=True)
+    Path(DATA_DIR).mkdir(exist_ok=True)
 
-    contract_list = scrape()
-    serializable_contracts = [c.to_dict() for c in contract_list]
+    serializable_contracts = scrape(as_dicts=True)
 
-    # Save to JSON for later use in transaction generator
-    with open(DEFAULT_CONTRACT_PATH, "w") as f:
-        json.dump(serializable_contracts, f, indent=4)
+    # Save to JSON for later use in transaction generator; orjson serializes
+    # straight to bytes, skipping json.dump's per-chunk str encoding
+    Path(DEFAULT_CONTRACT_PATH).write_bytes(
+        orjson.dumps(serializable_contracts, option=orjson.OPT_INDENT_2)
+    )
 
     print(f"Contracts saved to {DEFAULT_CONTRACT_PATH}")
\ No newline at end of file